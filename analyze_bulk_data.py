@@ -3,51 +3,83 @@
 Analyze bulk data structure in expansion card SysEx files.
 """
 
+import struct
+import sys
+from collections import defaultdict
+
+# Precomputed formatting tables so per-byte conversions are a tuple index
+_HEX = tuple(f'0x{i:x}' for i in range(256))
+_NAME_TABLE = bytes(i if 32 <= i <= 126 else ord('.') for i in range(256))
+
+# Part type byte -> (summary name, part number) for the known block types
+_PART_TYPE_INFO = {
+    0x00: ('common', None),
+    0x10: ('part_1', 1),
+    0x12: ('part_2', 2),
+    0x14: ('part_3', 3),
+    0x16: ('part_4', 4),
+}
+# Part type byte -> label shown in the per-message address breakdown
+_PART_TYPE_LABELS = tuple(
+    'common' if i == 0x00 else f'part {(i - 0x10) // 2 + 1}' if i >= 0x10 else 'unknown'
+    for i in range(256)
+)
+_ADDRESS_SPACE_LABELS = {0x11: 'expansion card'}
+
+# Reads the 4 address bytes following the F0 41 10 6A 12 header
+_ADDR_UNPACK = struct.Struct('BBBB').unpack_from
+
 def analyze_message(msg_bytes, message_num):
-    """Analyze a single SysEx message structure."""
-    print(f"\n=== Message {message_num} Analysis ===")
-    print(f"Total length: {len(msg_bytes)} bytes")
+    """Analyze a single SysEx message structure.
+
+    msg_bytes must be a bytes-like object (bytes or memoryview).
+    Returns (info, lines); output lines are collected rather than printed
+    so the caller can write the whole report at once.
+    """
+    out = []
+    out.append(f"\n=== Message {message_num} Analysis ===")
+    out.append(f"Total length: {len(msg_bytes)} bytes")
     
     # Extract components
     header = msg_bytes[:5]  # F0 41 10 6A 12
-    address = msg_bytes[5:9]
+    address = _ADDR_UNPACK(msg_bytes, 5)
+    addr_space, perf_slot, part_type, offset = address
     data = msg_bytes[9:-2]
     checksum = msg_bytes[-2]
     end = msg_bytes[-1]
     
-    print(f"Header: {[hex(x) for x in header]}")
-    print(f"Address: {[hex(x) for x in address]} - {address}")
-    print(f"Data length: {len(data)} bytes")
-    print(f"Checksum: {hex(checksum)}")
-    print(f"End: {hex(end)}")
+    out.append(f"Header: {[_HEX[x] for x in header]}")
+    out.append(f"Address: {[_HEX[x] for x in address]} - {list(address)}")
+    out.append(f"Data length: {len(data)} bytes")
+    out.append(f"Checksum: {_HEX[checksum]}")
+    out.append(f"End: {_HEX[end]}")
     
     # Address breakdown
-    addr_space, perf_slot, part_type, offset = address
-    print(f"  Address space: {hex(addr_space)} ({'expansion card' if addr_space == 0x11 else 'internal'})")
-    print(f"  Performance slot: {hex(perf_slot)} ({perf_slot})")
-    print(f"  Part type: {hex(part_type)} ({'common' if part_type == 0x00 else f'part {(part_type-0x10)//2+1}' if part_type >= 0x10 else 'unknown'})")
-    print(f"  Offset: {hex(offset)} ({offset})")
+    out.append(f"  Address space: {_HEX[addr_space]} ({_ADDRESS_SPACE_LABELS.get(addr_space, 'internal')})")
+    out.append(f"  Performance slot: {_HEX[perf_slot]} ({perf_slot})")
+    out.append(f"  Part type: {_HEX[part_type]} ({_PART_TYPE_LABELS[part_type]})")
+    out.append(f"  Offset: {_HEX[offset]} ({offset})")
     
     # Data analysis
+    _, part_num = _PART_TYPE_INFO.get(part_type, (None, None))
     if part_type == 0x00:  # Common parameters (performance name area)
         # First 12 bytes should be performance name
         name_bytes = data[:12]
-        name = ''.join(chr(b) if 32 <= b <= 126 else '.' for b in name_bytes)
-        print(f"  Performance name: '{name.strip()}'")
-        print(f"  Name bytes: {[hex(x) for x in name_bytes]}")
+        name = bytes(name_bytes).translate(_NAME_TABLE).decode('ascii')
+        out.append(f"  Performance name: '{name.strip()}'")
+        out.append(f"  Name bytes: {[_HEX[x] for x in name_bytes]}")
         
         # Rest are common parameters
         if len(data) > 12:
-            print(f"  Common parameters: {len(data)-12} bytes")
-            print(f"  First 16 param bytes: {[hex(x) for x in data[12:28]]}")
+            out.append(f"  Common parameters: {len(data)-12} bytes")
+            out.append(f"  First 16 param bytes: {[_HEX[x] for x in data[12:28]]}")
     
-    elif part_type in [0x10, 0x12, 0x14, 0x16]:  # Part parameters
-        part_num = (part_type - 0x10) // 2 + 1
-        print(f"  Part {part_num} parameters: {len(data)} bytes")
-        print(f"  First 16 bytes: {[hex(x) for x in data[:16]]}")
-        print(f"  Last 16 bytes: {[hex(x) for x in data[-16:]]}")
+    elif part_num is not None:  # Part parameters
+        out.append(f"  Part {part_num} parameters: {len(data)} bytes")
+        out.append(f"  First 16 bytes: {[_HEX[x] for x in data[:16]]}")
+        out.append(f"  Last 16 bytes: {[_HEX[x] for x in data[-16:]]}")
     
-    return {
+    info = {
         'address': address,
         'data_length': len(data),
         'address_space': addr_space,
@@ -56,62 +88,56 @@ def analyze_message(msg_bytes, message_num):
         'offset': offset,
         'data': data
     }
+    return info, out
 
 def main():
     with open('sysex_files/Vintage1.syx', 'rb') as f:
         data = f.read()
     
-    # Extract first 10 messages
-    pos = 0
+    # Extract first 10 messages, locating delimiters with bytes.find.
+    # Messages are memoryview slices so no bytes are copied out of data.
+    mv = memoryview(data)
     messages = []
-    while pos < len(data) and len(messages) < 10:
-        if data[pos] == 0xF0:
-            start = pos
-            pos += 1
-            while pos < len(data) and data[pos] != 0xF7:
-                pos += 1
-            if pos < len(data):
-                pos += 1  # Include F7
-                messages.append(data[start:pos])
-        else:
-            pos += 1
+    pos = data.find(0xF0)
+    while pos != -1 and len(messages) < 10:
+        end = data.find(0xF7, pos + 1)
+        if end == -1:
+            break
+        messages.append(mv[pos:end + 1])  # Include F7
+        pos = data.find(0xF0, end + 1)
     
-    print(f"Analyzing first {len(messages)} messages from Vintage1.syx")
+    out = []
+    out.append(f"Analyzing first {len(messages)} messages from Vintage1.syx")
     
     message_info = []
     for i, msg in enumerate(messages):
-        msg_bytes = list(msg)
-        info = analyze_message(msg_bytes, i+1)
+        info, lines = analyze_message(msg, i+1)
         message_info.append(info)
+        out.extend(lines)
     
     # Summary
-    print("\n=== SUMMARY ===")
-    print("Message patterns found:")
+    out.append("\n=== SUMMARY ===")
+    out.append("Message patterns found:")
     for info in message_info:
         addr = info['address']
-        print(f"  {[hex(x) for x in addr]} -> {info['data_length']} bytes")
+        out.append(f"  {[_HEX[x] for x in addr]} -> {info['data_length']} bytes")
     
     # Group by performance slot
-    perf_slots = {}
+    perf_slots = defaultdict(list)
     for info in message_info:
-        slot = info['performance_slot']
-        if slot not in perf_slots:
-            perf_slots[slot] = []
-        perf_slots[slot].append(info)
+        perf_slots[info['performance_slot']].append(info)
     
-    print(f"\nPerformance slots found: {sorted(perf_slots.keys())}")
-    for slot in sorted(perf_slots.keys()):
+    slots = sorted(perf_slots)
+    out.append(f"\nPerformance slots found: {slots}")
+    for slot in slots:
         messages = perf_slots[slot]
-        print(f"  Slot {slot}: {len(messages)} messages")
+        out.append(f"  Slot {slot}: {len(messages)} messages")
         for msg in messages:
             part_type = msg['part_type']
-            if part_type == 0x00:
-                part_name = "common"
-            elif part_type in [0x10, 0x12, 0x14, 0x16]:
-                part_name = f"part_{(part_type-0x10)//2+1}"
-            else:
-                part_name = f"unknown_{hex(part_type)}"
-            print(f"    {part_name}: {msg['data_length']} bytes")
+            part_name, _ = _PART_TYPE_INFO.get(part_type, (f"unknown_{_HEX[part_type]}", None))
+            out.append(f"    {part_name}: {msg['data_length']} bytes")
+    
+    sys.stdout.write('\n'.join(out) + '\n')
 
 if __name__ == "__main__":
     main()
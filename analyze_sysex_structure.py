@@ -3,6 +3,12 @@
 Analyze the structure of expansion card SysEx messages to understand bulk data format
 """
 
+import sys
+
+# Precomputed formatting tables so per-byte conversions are a tuple index
+_HX2 = tuple(f'{i:02X}' for i in range(256))
+_NAME_TABLE = bytes(i if 32 <= i <= 126 else ord('.') for i in range(256))
+
 def analyze_sysex_structure():
     """Analyze the raw structure of expansion card SysEx messages."""
     
@@ -11,34 +17,31 @@ def analyze_sysex_structure():
     with open(file_path, 'rb') as f:
         data = f.read()
     
-    # Extract first few messages
+    # Extract messages by jumping between F0/F7 delimiters with bytes.find
+    # (memchr in C) rather than stepping through every byte in Python
     messages = []
-    current_message = []
-    in_sysex = False
+    pos = data.find(0xF0)
+    while pos != -1:
+        end = data.find(0xF7, pos + 1)
+        next_start = data.find(0xF0, pos + 1)
+        if next_start != -1 and (end == -1 or next_start < end):
+            # Unterminated message interrupted by a new F0
+            messages.append(data[pos:next_start])
+            pos = next_start
+            continue
+        if end == -1:
+            break
+        messages.append(data[pos:end + 1])
+        pos = data.find(0xF0, end + 1)
     
-    for byte in data:
-        if byte == 0xF0:
-            if current_message:
-                messages.append(current_message)
-            current_message = [byte]
-            in_sysex = True
-        elif byte == 0xF7:
-            if in_sysex:
-                current_message.append(byte)
-                messages.append(current_message)
-                current_message = []
-                in_sysex = False
-        elif in_sysex:
-            current_message.append(byte)
-    
-    print(f"Total messages: {len(messages)}")
+    out = [f"Total messages: {len(messages)}"]
     
     # Analyze first few messages in detail
     for i in range(min(5, len(messages))):
         msg = messages[i]
-        print(f"\n--- Message {i} ---")
-        print(f"Length: {len(msg)} bytes")
-        print(f"Header: {' '.join(f'{b:02X}' for b in msg[:10])}")
+        out.append(f"\n--- Message {i} ---")
+        out.append(f"Length: {len(msg)} bytes")
+        out.append(f"Header: {' '.join(_HX2[b] for b in msg[:10])}")
         
         if len(msg) >= 10:
             # F0 41 10 6A 12 [addr1] [addr2] [addr3] [addr4] [data...]
@@ -46,19 +49,21 @@ def analyze_sysex_structure():
             data_section = msg[9:-2]  # Exclude checksum and F7
             checksum = msg[-2]
             
-            print(f"Address: {' '.join(f'{a:02X}' for a in addr)}")
-            print(f"Data length: {len(data_section)} bytes")
-            print(f"Checksum: {checksum:02X}")
+            out.append(f"Address: {' '.join(_HX2[a] for a in addr)}")
+            out.append(f"Data length: {len(data_section)} bytes")
+            out.append(f"Checksum: {checksum:02X}")
             
             # For performance name messages (address ending in 00 00), show as text
             if addr[2] == 0x00 and addr[3] == 0x00:
                 # First 12 bytes are typically the performance name
                 name_bytes = data_section[:12]
-                name_text = ''.join(chr(b) if 32 <= b <= 126 else '.' for b in name_bytes)
-                print(f"Performance name: '{name_text}'")
-                print(f"First 20 data bytes: {' '.join(f'{b:02X}' for b in data_section[:20])}")
+                name_text = bytes(name_bytes).translate(_NAME_TABLE).decode('ascii')
+                out.append(f"Performance name: '{name_text}'")
+                out.append(f"First 20 data bytes: {' '.join(_HX2[b] for b in data_section[:20])}")
             else:
-                print(f"First 20 data bytes: {' '.join(f'{b:02X}' for b in data_section[:20])}")
+                out.append(f"First 20 data bytes: {' '.join(_HX2[b] for b in data_section[:20])}")
+    
+    sys.stdout.write('\n'.join(out) + '\n')
 
 if __name__ == "__main__":
     try:
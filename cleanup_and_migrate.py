@@ -3,106 +3,14 @@ Cleanup and Migration Script for JV-1080 SysEx Manager
 Organizes old files and migrates to the new YAML-based system.
 """
 
+import os
 import shutil
 from pathlib import Path
 import logging
 from typing import List, Dict
 
-def setup_logging():
-    """Set up logging for the cleanup process."""
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler('cleanup_migration.log'),
-            logging.StreamHandler()
-        ]
-    )
-    return logging.getLogger(__name__)
-
-def create_directory_structure(base_path: Path, logger: logging.Logger):
-    """Create the new organized directory structure."""
-    directories = [
-        "legacy",
-        "legacy/scripts",
-        "legacy/config",
-        "presets",
-        "presets/exported",
-        "presets/python",
-        "sysex_files",
-        "examples",
-        "docs"
-    ]
-    
-    for directory in directories:
-        dir_path = base_path / directory
-        dir_path.mkdir(exist_ok=True)
-        logger.info(f"Created directory: {directory}")
-
-def move_legacy_files(base_path: Path, logger: logging.Logger):
-    """Move old files to legacy directory."""
-    legacy_dir = base_path / "legacy"
-    legacy_scripts = legacy_dir / "scripts"
-    legacy_config = legacy_dir / "config"
-    
-    # Files to move to legacy/scripts
-    script_files = [
-        "BaselineSwitchModes.py",
-        "JV_TempPatchMode.py",
-        "JV1080_SH-101Module.py",
-        "MidiCommTest.py",
-        "MonosynthModule.py",
-        "Roland_sysex_working_241230.py",
-        "RolandSysExManager.py",  # The one in scripts/
-        "SwitchModes.py",
-        "SwitchModes_Ch.py",
-        "Sysex_Parser.py",
-        "SysexTest.py",
-        "TempTestBeta.py",
-    ]
-    
-    # Move scripts
-    scripts_dir = base_path / "scripts"
-    if scripts_dir.exists():
-        for script_file in script_files:
-            source = scripts_dir / script_file
-            if source.exists():
-                destination = legacy_scripts / script_file
-                shutil.move(str(source), str(destination))
-                logger.info(f"Moved {script_file} to legacy/scripts/")
-    
-    # Files to move to legacy/config
-    config_files = [
-        "Global.ini",
-        "jv1080_patch_database.json",
-        "Roland_JV1080_Patches.ini",
-        "TempTestBetaDelay.ini"
-    ]
-    
-    config_dir = base_path / "config"
-    if config_dir.exists():
-        for config_file in config_files:
-            source = config_dir / config_file
-            if source.exists():
-                destination = legacy_config / config_file
-                shutil.move(str(source), str(destination))
-                logger.info(f"Moved {config_file} to legacy/config/")
-    
-    # Move old RolandSysExManager.py from root
-    old_manager = base_path / "RolandSysExManager.py"
-    if old_manager.exists():
-        shutil.move(str(old_manager), str(legacy_dir / "RolandSysExManager.py"))
-        logger.info("Moved root RolandSysExManager.py to legacy/")
-    
-    # Move performance_builder_gui.py
-    old_gui = base_path / "performance_builder_gui.py"
-    if old_gui.exists():
-        shutil.move(str(old_gui), str(legacy_scripts / "performance_builder_gui.py"))
-        logger.info("Moved performance_builder_gui.py to legacy/scripts/")
-
-def update_requirements(base_path: Path, logger: logging.Logger):
-    """Update requirements.txt with new dependencies."""
-    requirements_content = """# JV-1080 SysEx Manager Requirements
+# File contents written by the migration, kept as module-level constants
+_REQUIREMENTS = """# JV-1080 SysEx Manager Requirements
 mido>=1.2.10
 python-rtmidi>=1.4.0
 PyYAML>=6.0
@@ -111,16 +19,8 @@ pytest>=7.0.0
 # Optional GUI dependencies
 tkinter  # Usually included with Python
 """
-    
-    requirements_path = base_path / "requirements.txt"
-    with open(requirements_path, 'w') as f:
-        f.write(requirements_content)
-    
-    logger.info("Updated requirements.txt")
 
-def create_readme(base_path: Path, logger: logging.Logger):
-    """Create updated README.md with new structure."""
-    readme_content = """# JV-1080 SysEx Manager
+_README = """# JV-1080 SysEx Manager
 
 Modern Python library for controlling the Roland JV-1080 synthesizer via MIDI SysEx messages.
 
@@ -301,18 +201,7 @@ See LICENSE file for details.
 - [ ] Performance optimization for large preset collections
 """
 
-    readme_path = base_path / "README.md"
-    with open(readme_path, 'w', encoding='utf-8') as f:
-        f.write(readme_content)
-    
-    logger.info("Created updated README.md")
-
-def create_examples(base_path: Path, logger: logging.Logger):
-    """Create example files."""
-    examples_dir = base_path / "examples"
-    
-    # Basic usage example
-    basic_example = """#!/usr/bin/env python3
+_BASIC_EXAMPLE = """#!/usr/bin/env python3
 \"\"\"
 Basic JV-1080 Usage Example
 Demonstrates fundamental operations with the JV-1080.
@@ -354,12 +243,8 @@ def main():
 if __name__ == "__main__":
     main()
 """
-    
-    with open(examples_dir / "basic_usage.py", 'w') as f:
-        f.write(basic_example)
-    
-    # Preset example
-    preset_example = """#!/usr/bin/env python3
+
+_PRESET_EXAMPLE = """#!/usr/bin/env python3
 \"\"\"
 Preset Management Example
 Shows how to create, save, and load presets.
@@ -367,10 +252,8 @@ Shows how to create, save, and load presets.
 
 from preset_builder import PresetBuilder
 
-def create_sample_preset():
+def create_sample_preset(builder):
     \"\"\"Create a sample preset.\"\"\"
-    builder = PresetBuilder()
-    
     # Create new preset
     preset = builder.create_new_preset(
         name="Ambient Pad",
@@ -399,41 +282,28 @@ def main():
     
     # Create sample preset
     print("Creating sample preset...")
-    preset = create_sample_preset()
+    preset = create_sample_preset(builder)
     
-    # Save to JSON
+    # Save to JSON and export to Python back to back from the same preset
     print("Saving preset...")
     builder.save_preset(preset, "ambient_pad.json")
-    
-    # Export to Python
     print("Exporting to Python...")
     builder.export_preset_to_python(preset, "ambient_pad_preset.py")
     
-    # Load and apply
-    print("Loading preset...")
-    loaded_preset = builder.load_preset("ambient_pad.json")
-    
-    if loaded_preset:
-        port = builder.manager.select_midi_port()
-        if port:
-            print("Applying preset to JV-1080...")
-            success, total = builder.apply_preset_to_jv1080(loaded_preset, port)
-            print(f"Applied {success}/{total} parameters successfully!")
+    # Apply the in-memory preset; no need to load the JSON back first
+    port = builder.manager.select_midi_port()
+    if port:
+        print("Applying preset to JV-1080...")
+        success, total = builder.apply_preset_to_jv1080(preset, port)
+        print(f"Applied {success}/{total} parameters successfully!")
     
     print("Preset example completed!")
 
 if __name__ == "__main__":
     main()
 """
-    
-    with open(examples_dir / "preset_management.py", 'w') as f:
-        f.write(preset_example)
-    
-    logger.info("Created example files")
 
-def create_gitignore(base_path: Path, logger: logging.Logger):
-    """Create .gitignore file."""
-    gitignore_content = """# Python
+_GITIGNORE = """# Python
 __pycache__/
 *.py[cod]
 *$py.class
@@ -488,10 +358,152 @@ temp_*
 .DS_Store
 Thumbs.db
 """
+
+def setup_logging():
+    """Set up logging for the cleanup process."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('cleanup_migration.log'),
+            logging.StreamHandler()
+        ]
+    )
+    return logging.getLogger(__name__)
+
+def _list_entries(directory: Path) -> set:
+    """Return the names present in a directory (empty if it doesn't exist).
+
+    A single directory read replaces one stat() probe per candidate file.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except FileNotFoundError:
+        return set()
+
+def _fast_move(source: Path, destination: Path):
+    """Move a file with a single rename, falling back to shutil.move.
+
+    shutil.move is only needed when the rename fails (e.g. across
+    filesystems).
+    """
+    try:
+        os.rename(source, destination)
+    except OSError:
+        shutil.move(str(source), str(destination))
+
+def create_directory_structure(base_path: Path, logger: logging.Logger):
+    """Create the new organized directory structure."""
+    directories = [
+        "legacy",
+        "legacy/scripts",
+        "legacy/config",
+        "presets",
+        "presets/exported",
+        "presets/python",
+        "sysex_files",
+        "examples",
+        "docs"
+    ]
     
-    gitignore_path = base_path / ".gitignore"
-    with open(gitignore_path, 'w') as f:
-        f.write(gitignore_content)
+    for directory in directories:
+        dir_path = base_path / directory
+        dir_path.mkdir(exist_ok=True)
+    logger.info("Created directories: %s", ', '.join(directories))
+
+def move_legacy_files(base_path: Path, logger: logging.Logger):
+    """Move old files to legacy directory."""
+    legacy_dir = base_path / "legacy"
+    legacy_scripts = legacy_dir / "scripts"
+    legacy_config = legacy_dir / "config"
+    
+    # Files to move to legacy/scripts
+    script_files = [
+        "BaselineSwitchModes.py",
+        "JV_TempPatchMode.py",
+        "JV1080_SH-101Module.py",
+        "MidiCommTest.py",
+        "MonosynthModule.py",
+        "Roland_sysex_working_241230.py",
+        "RolandSysExManager.py",  # The one in scripts/
+        "SwitchModes.py",
+        "SwitchModes_Ch.py",
+        "Sysex_Parser.py",
+        "SysexTest.py",
+        "TempTestBeta.py",
+    ]
+    
+    # Move scripts
+    scripts_dir = base_path / "scripts"
+    present = _list_entries(scripts_dir)
+    moved = []
+    for script_file in script_files:
+        if script_file in present:
+            _fast_move(scripts_dir / script_file, legacy_scripts / script_file)
+            moved.append(script_file)
+    if moved:
+        logger.info("Moved to legacy/scripts/: %s", ', '.join(moved))
+    
+    # Files to move to legacy/config
+    config_files = [
+        "Global.ini",
+        "jv1080_patch_database.json",
+        "Roland_JV1080_Patches.ini",
+        "TempTestBetaDelay.ini"
+    ]
+    
+    config_dir = base_path / "config"
+    present = _list_entries(config_dir)
+    moved = []
+    for config_file in config_files:
+        if config_file in present:
+            _fast_move(config_dir / config_file, legacy_config / config_file)
+            moved.append(config_file)
+    if moved:
+        logger.info("Moved to legacy/config/: %s", ', '.join(moved))
+    
+    root_present = _list_entries(base_path)
+    
+    # Move old RolandSysExManager.py from root
+    old_manager = base_path / "RolandSysExManager.py"
+    if old_manager.name in root_present:
+        _fast_move(old_manager, legacy_dir / "RolandSysExManager.py")
+        logger.info("Moved root RolandSysExManager.py to legacy/")
+    
+    # Move performance_builder_gui.py
+    old_gui = base_path / "performance_builder_gui.py"
+    if old_gui.name in root_present:
+        _fast_move(old_gui, legacy_scripts / "performance_builder_gui.py")
+        logger.info("Moved performance_builder_gui.py to legacy/scripts/")
+
+def update_requirements(base_path: Path, logger: logging.Logger):
+    """Update requirements.txt with new dependencies."""
+    (base_path / "requirements.txt").write_text(_REQUIREMENTS, encoding='utf-8')
+    
+    logger.info("Updated requirements.txt")
+
+def create_readme(base_path: Path, logger: logging.Logger):
+    """Create updated README.md with new structure."""
+    (base_path / "README.md").write_text(_README, encoding='utf-8')
+    
+    logger.info("Created updated README.md")
+
+def create_examples(base_path: Path, logger: logging.Logger):
+    """Create example files."""
+    examples_dir = base_path / "examples"
+    
+    # Basic usage example
+    (examples_dir / "basic_usage.py").write_text(_BASIC_EXAMPLE, encoding='utf-8')
+    
+    # Preset example
+    (examples_dir / "preset_management.py").write_text(_PRESET_EXAMPLE, encoding='utf-8')
+    
+    logger.info("Created example files")
+
+def create_gitignore(base_path: Path, logger: logging.Logger):
+    """Create .gitignore file."""
+    (base_path / ".gitignore").write_text(_GITIGNORE, encoding='utf-8')
     
     logger.info("Created .gitignore")
 
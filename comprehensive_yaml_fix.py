@@ -5,50 +5,81 @@ Fixes common YAML issues including negative number quoting and formatting
 """
 
 import re
+import shutil
 import yaml
 from pathlib import Path
 
+# Prefer the libyaml-backed C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# All in-line fixes are driven by one compiled alternation so the content is
+# scanned once instead of once per rule. Alternatives are ordered so that the
+# more specific rewrites win at a given position, and each one reproduces the
+# result of the former sequence of re.sub passes.
+_PAT_INLINE_FIXES = re.compile(
+    r'(?P<bytes_key>\w*bytes):\s*1\s*(?:-\s*(?=name:)|(?P<bytes_hash>#))'
+    r'|(?P<neg_key>\w*(?:min|max)):\s*(?P<neg>-\d+)'
+    r'|(?P<num_key>\w+):\s*(?P<num>\d+)(?:(?P<quote_key>\w*):\s*")?'
+    r'|(?P<key>\w+):\s*"'
+)
+_PAT_DESCRIPTION = re.compile(r'description:\s*([^"\n][^:\n]*?)(?=\n)')
+
+def _apply_inline_fix(match):
+    """Rewrite a single match of _PAT_INLINE_FIXES."""
+    if match.group('bytes_key'):
+        # Split concatenated lines (bytes: 1 - name: / bytes: 1 #)
+        tail = '#' if match.group('bytes_hash') else '- '
+        return f"{match.group('bytes_key')}: 1\n        {tail}"
+    if match.group('neg_key'):
+        # Quote negative numbers
+        return f'{match.group("neg_key")}: "{match.group("neg")}"'
+    # Consistent spacing around colons
+    if match.group('num_key'):
+        fixed = f"{match.group('num_key')}: {match.group('num')}"
+        if match.group('quote_key') is not None:
+            fixed += f'{match.group("quote_key")}: "'
+        return fixed
+    return f'{match.group("key")}: "'
+
 def fix_yaml_file(input_file):
     """Fix YAML formatting issues"""
     
+    # Read content
+    content = input_file.read_text(encoding='utf-8')
+    
+    # Nothing to do (and no backup needed) if the file already parses
+    try:
+        yaml.load(content, Loader=_Loader)
+        print("✅ YAML is already valid - skipping fixes")
+        return True
+    except yaml.YAMLError:
+        pass
+    
     # Create backup
     backup_file = input_file.with_suffix('.yaml.backup')
     print(f"Creating backup: {backup_file}")
-    backup_file.write_text(input_file.read_text(encoding='utf-8'), encoding='utf-8')
-    
-    # Read content
-    content = input_file.read_text(encoding='utf-8')
+    shutil.copyfile(input_file, backup_file)
     
     print("Fixing YAML formatting issues...")
     
-    # Fix 1: Ensure negative numbers are properly quoted
+    # Fixes 1-3: Quote negative numbers, normalize colon spacing and split
+    # concatenated lines in a single regex pass
     print("  - Quoting negative numbers...")
-    content = re.sub(r'min:\s*(-\d+)', r'min: "\1"', content)
-    content = re.sub(r'max:\s*(-\d+)', r'max: "\1"', content)
-    
-    # Fix 2: Ensure consistent spacing around colons
     print("  - Fixing colon spacing...")
-    content = re.sub(r'(\w+):\s*"', r'\1: "', content)
-    content = re.sub(r'(\w+):\s*(\d+)', r'\1: \2', content)
-    
-    # Fix 3: Fix any line break issues (concatenated lines)
     print("  - Fixing line break issues...")
-    content = re.sub(r'bytes:\s*1\s*-\s*name:', 'bytes: 1\n        - name:', content)
-    content = re.sub(r'bytes:\s*1\s*#', 'bytes: 1\n        #', content)
+    content = _PAT_INLINE_FIXES.sub(_apply_inline_fix, content)
     
-    # Fix 4: Ensure proper indentation (replace tabs with spaces)
+    # Fix 4 & 5: Replace tabs with spaces and remove trailing whitespace
     print("  - Normalizing indentation...")
-    content = content.replace('\t', '  ')
-    
-    # Fix 5: Remove any trailing whitespace
     print("  - Removing trailing whitespace...")
-    lines = content.split('\n')
-    lines = [line.rstrip() for line in lines]
-    content = '\n'.join(lines)
+    content = '\n'.join(line.replace('\t', '  ').rstrip() for line in content.split('\n'))
     
     # Fix 6: Ensure proper YAML structure (add quotes around description values if missing)
     print("  - Ensuring proper string quoting...")
-    content = re.sub(r'description:\s*([^"\n][^:\n]*?)(?=\n)', r'description: "\1"', content)
+    content = _PAT_DESCRIPTION.sub(r'description: "\1"', content)
     
     # Write fixed content
     print(f"Writing fixed content to: {input_file}")
@@ -57,8 +88,7 @@ def fix_yaml_file(input_file):
     # Validate YAML
     print("Validating YAML syntax...")
     try:
-        with open(input_file, 'r', encoding='utf-8') as f:
-            yaml.safe_load(f)
+        yaml.load(content, Loader=_Loader)
         print("✅ YAML syntax is valid!")
         return True
     except yaml.YAMLError as e:
@@ -66,7 +96,7 @@ def fix_yaml_file(input_file):
         
         # Restore from backup if validation fails
         print(f"Restoring from backup: {backup_file}")
-        input_file.write_text(backup_file.read_text(encoding='utf-8'), encoding='utf-8')
+        shutil.copyfile(backup_file, input_file)
         return False
 
 def main():
@@ -3,58 +3,83 @@
 Debug script to examine expansion card SysEx addresses
 """
 
+import mmap
+import os
 import sys
+from itertools import islice
 from pathlib import Path
 
+def hx(data) -> str:
+    """Format bytes as space-separated uppercase hex (e.g. 'F0 41 10')."""
+    return bytes(data).hex(' ').upper()
+
+def hx_addr(addr: int) -> str:
+    """Format a packed 4-byte address (see analyze_expansion_addresses) as hex."""
+    return hx(addr.to_bytes(4, 'big'))
+
+def map_sysex_file(file_path):
+    """Memory-map a .syx file read-only instead of reading it into RAM.
+
+    The mapping stays valid after the file is closed and is unmapped once
+    the last message view into it is garbage collected. Empty files map to
+    b'' since mmap cannot map zero bytes.
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b''
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
 def extract_sysex_messages(data: bytes):
-    """Extract individual SysEx messages from binary data."""
-    messages = []
-    current_message = []
-    in_sysex = False
-    
-    for byte in data:
-        if byte == 0xF0:  # Start of SysEx
-            if in_sysex and current_message:
-                print("Warning: F0 found before F7")
-            current_message = [byte]
-            in_sysex = True
-        elif byte == 0xF7:  # End of SysEx
-            if in_sysex:
-                current_message.append(byte)
-                messages.append(current_message)
-                current_message = []
-                in_sysex = False
-        elif in_sysex:
-            current_message.append(byte)
+    """Yield individual SysEx messages from binary data.
+
+    Delimiters are located with bytes.find and messages are yielded as
+    zero-copy memoryview slices of data, so callers that only look at the
+    first few messages never build the full list.
+    """
+    mv = memoryview(data)
+    pos = data.find(b'\xF0')
     
-    return messages
+    while pos != -1:
+        end = data.find(b'\xF7', pos + 1)
+        # An unterminated tail is still scanned for restarting F0s
+        restart = data.find(b'\xF0', pos + 1, len(data) if end == -1 else end)
+        if restart != -1:
+            # Drop the unterminated message and resync on the new F0
+            print("Warning: F0 found before F7")
+            pos = restart
+            continue
+        if end == -1:
+            break
+        yield mv[pos:end + 1]
+        pos = data.find(b'\xF0', end + 1)
 
 def analyze_expansion_addresses(file_path):
     """Analyze the first few SysEx messages to understand address structure."""
     print(f"\nAnalyzing: {file_path}")
     
-    with open(file_path, 'rb') as f:
-        data = f.read()
-    
-    messages = extract_sysex_messages(data)
-    print(f"Total messages found: {len(messages)}")
+    # Keep only the first 10 messages; the rest are counted, not stored
+    messages = extract_sysex_messages(map_sysex_file(file_path))
+    first_messages = list(islice(messages, 10))
+    total = len(first_messages) + sum(1 for _ in messages)
+    print(f"Total messages found: {total}")
     
-    # Analyze first 10 messages
+    # Analyze first 10 messages; addresses are packed into a single int so
+    # the set hashes and sorts plain integers instead of 4-tuples
     unique_addresses = set()
-    for i, msg in enumerate(messages[:10]):
+    for i, msg in enumerate(first_messages):
         if len(msg) >= 10:
             # F0 41 10 6A 12 [addr1] [addr2] [addr3] [addr4] [data...] [checksum] F7
             #  0  1  2  3  4     5      6      7      8      9...
-            addr = tuple(msg[5:9])
+            addr = int.from_bytes(msg[5:9], 'big')
             unique_addresses.add(addr)
             
-            print(f"Message {i:3d}: {' '.join(f'{b:02X}' for b in msg[:15])}... "
-                  f"Addr: {' '.join(f'{a:02X}' for a in addr)} "
+            print(f"Message {i:3d}: {hx(msg[:15])}... "
+                  f"Addr: {hx_addr(addr)} "
                   f"Data: {msg[9]:02X}")
     
     print(f"\nUnique addresses in first 10 messages: {len(unique_addresses)}")
     for addr in sorted(unique_addresses):
-        print(f"  {' '.join(f'{a:02X}' for a in addr)}")
+        print(f"  {hx_addr(addr)}")
     
     return unique_addresses
 
@@ -78,7 +103,7 @@ if __name__ == "__main__":
         print(f"\n=== SUMMARY ===")
         print(f"All unique addresses found: {len(all_addresses)}")
         for addr in sorted(all_addresses):
-            print(f"  {' '.join(f'{a:02X}' for a in addr)}")
+            print(f"  {hx_addr(addr)}")
     except Exception as e:
         print(f"Error: {e}")
         import traceback
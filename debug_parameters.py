@@ -12,18 +12,21 @@ for group in groups:
 
 print(f"\nParameters in 'temp_performance_common':")
 params = manager.list_parameters('temp_performance_common')
+efx_params = []
 for i, param in enumerate(params):
     print(f"  {i+1:2d}. {param}")
+    # Collect EFX-related names during the listing walk
+    if 'EFX' in param:
+        efx_params.append(param)
 
 print(f"\nTotal parameters: {len(params)}")
 
 # Check if EFX:Type is in there
-if 'EFX:Type' in params:
+if 'EFX:Type' in efx_params:
     print("\n✅ EFX:Type found!")
 else:
     print("\n❌ EFX:Type NOT found!")
     # Show which params contain 'EFX'
-    efx_params = [p for p in params if 'EFX' in p]
     if efx_params:
         print("EFX-related parameters found:")
         for p in efx_params:
@@ -5,6 +5,11 @@ Analyzes the structure of expansion card SysEx files to understand why we're onl
 """
 
 import logging
+import mmap
+import os
+import struct
+import sys
+from collections import Counter
 from pathlib import Path
 from sysex_parser import SysExParser
 
@@ -12,102 +17,128 @@ from sysex_parser import SysExParser
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Descriptions for the part type byte (address[2]) of expansion card messages
+_PART_TYPE_DESC = {
+    0x00: "Performance Common",
+    0x10: "Performance Part 1", 0x12: "Performance Part 2", 
+    0x14: "Performance Part 3", 0x16: "Performance Part 4",
+    0x20: "Patch Common",
+    0x22: "Patch Part 1", 0x24: "Patch Part 2", 
+    0x26: "Patch Part 3", 0x28: "Patch Part 4",
+    0x60: "Rhythm Common"
+}
+
+# Part type bytes used for rhythm parts
+_RHYTHM_RANGE = range(0x24, 0x63)
+
+# Manufacturer/device/model/command (offset 1) and address (offset 5) unpackers
+_HEADER_UNPACK = struct.Struct('BBBB').unpack_from
+_ADDR_UNPACK = struct.Struct('BBBB').unpack_from
+
+def hx(data) -> str:
+    """Format bytes as space-separated uppercase hex (e.g. 'F0 41 10')."""
+    return bytes(data).hex(' ').upper()
+
+def map_sysex_file(file_path):
+    """Memory-map a .syx file read-only instead of reading it into RAM.
+
+    The mapping stays valid after the file is closed and is unmapped once
+    the last message view into it is garbage collected. Empty files map to
+    b'' since mmap cannot map zero bytes.
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b''
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
 def analyze_sysex_messages(file_path: str):
     """Analyze raw SysEx messages in a file."""
-    print(f"=== Analyzing {file_path} ===")
+    # Report lines are collected and written in one call at the end
+    out = []
+    out.append(f"=== Analyzing {file_path} ===")
     
-    # Read binary data
-    with open(file_path, 'rb') as f:
-        data = f.read()
+    # Map binary data
+    data = map_sysex_file(file_path)
     
-    print(f"File size: {len(data)} bytes")
+    out.append(f"File size: {len(data)} bytes")
     
-    # Extract SysEx messages manually
+    # Extract SysEx messages manually, locating delimiters with bytes.find
+    # and keeping zero-copy memoryview slices of the file data
+    mv = memoryview(data)
     messages = []
-    current_message = []
-    in_sysex = False
+    pos = data.find(b'\xF0')
     
-    for byte in data:
-        if byte == 0xF0:  # Start of SysEx
-            if in_sysex and current_message:
-                print(f"Warning: Malformed SysEx - F0 found before F7")
-            current_message = [byte]
-            in_sysex = True
-        elif byte == 0xF7:  # End of SysEx
-            if in_sysex:
-                current_message.append(byte)
-                messages.append(current_message)
-                current_message = []
-                in_sysex = False
-        elif in_sysex:
-            current_message.append(byte)
+    while pos != -1:
+        end = data.find(b'\xF7', pos + 1)
+        # An unterminated tail is still scanned for restarting F0s
+        restart = data.find(b'\xF0', pos + 1, len(data) if end == -1 else end)
+        if restart != -1:
+            out.append(f"Warning: Malformed SysEx - F0 found before F7")
+            pos = restart
+            continue
+        if end == -1:
+            break
+        messages.append(mv[pos:end + 1])
+        pos = data.find(b'\xF0', end + 1)
     
-    print(f"Found {len(messages)} SysEx messages")
+    out.append(f"Found {len(messages)} SysEx messages")
     
-    # Analyze first few messages
+    # Classify every message once; the first few are also shown in detail
     roland_messages = []
-    for i, msg in enumerate(messages[:10]):
-        print(f"\nMessage {i}: {len(msg)} bytes")
-        hex_msg = " ".join(f"{b:02X}" for b in msg)
-        print(f"  Hex: {hex_msg}")
+    part_bytes = bytearray()  # part type byte (address[2]) of each expansion message
+    for i, msg in enumerate(messages):
+        is_expansion = len(msg) >= 9 and msg[5] == 0x11
+        if is_expansion:
+            part_bytes.append(msg[7])
+        if i >= 10:
+            continue
+        
+        out.append(f"\nMessage {i}: {len(msg)} bytes")
+        hex_msg = hx(msg)
+        out.append(f"  Hex: {hex_msg}")
         
         if len(msg) >= 6:
-            manufacturer = msg[1]
-            device_id = msg[2] 
-            model = msg[3]
-            command = msg[4]
+            manufacturer, device_id, model, command = _HEADER_UNPACK(msg, 1)
             
-            print(f"  Manufacturer: {manufacturer:02X} ({'Roland' if manufacturer == 0x41 else 'Unknown'})")
-            print(f"  Device ID: {device_id:02X}")
-            print(f"  Model: {model:02X} ({'JV-1080' if model == 0x6A else 'Unknown'})")
-            print(f"  Command: {command:02X} ({'DT1' if command == 0x12 else 'Other'})")
+            out.append(f"  Manufacturer: {manufacturer:02X} ({'Roland' if manufacturer == 0x41 else 'Unknown'})")
+            out.append(f"  Device ID: {device_id:02X}")
+            out.append(f"  Model: {model:02X} ({'JV-1080' if model == 0x6A else 'Unknown'})")
+            out.append(f"  Command: {command:02X} ({'DT1' if command == 0x12 else 'Other'})")
             
             if len(msg) >= 10:
-                address = msg[5:9]
+                address = _ADDR_UNPACK(msg, 5)
                 data_bytes = msg[9:-2]  # Exclude checksum and F7
                 
-                print(f"  Address: {' '.join(f'{b:02X}' for b in address)}")
-                print(f"  Data: {len(data_bytes)} bytes - {' '.join(f'{b:02X}' for b in data_bytes[:8])}{'...' if len(data_bytes) > 8 else ''}")
+                out.append(f"  Address: {hx(address)}")
+                out.append(f"  Data: {len(data_bytes)} bytes - {hx(data_bytes[:8])}{'...' if len(data_bytes) > 8 else ''}")
                 
                 # Check if this is expansion card space (0x11)
-                if address[0] == 0x11:
-                    perf_slot = address[1]
-                    part_type = address[2]
-                    offset = address[3]
-                    print(f"    Expansion Card - Performance: {perf_slot}, Part Type: {part_type:02X}, Offset: {offset:02X}")
+                if is_expansion:
+                    _, perf_slot, part_type, offset = address
+                    out.append(f"    Expansion Card - Performance: {perf_slot}, Part Type: {part_type:02X}, Offset: {offset:02X}")
                     roland_messages.append((i, address, data_bytes))
     
-    print(f"\n=== Summary ===")
-    print(f"Total messages: {len(messages)}")
-    expansion_msgs = [msg for msg in messages if len(msg) >= 9 and msg[5] == 0x11]
-    print(f"Expansion card messages (0x11 address space): {len(expansion_msgs)}")
+    out.append(f"\n=== Summary ===")
+    out.append(f"Total messages: {len(messages)}")
+    out.append(f"Expansion card messages (0x11 address space): {len(part_bytes)}")
     
     # Analyze part types in expansion messages
-    if expansion_msgs:
-        part_types = {}
-        for msg in expansion_msgs:
-            if len(msg) >= 8:
-                part_type = msg[7]  # address[2]
-                part_types[part_type] = part_types.get(part_type, 0) + 1
+    if part_bytes:
+        # Tally the gathered part type bytes in one pass
+        part_types = Counter(part_bytes)
         
-        print("\nPart types found:")
+        out.append("\nPart types found:")
         for part_type, count in sorted(part_types.items()):
-            description = {
-                0x00: "Performance Common",
-                0x10: "Performance Part 1", 0x12: "Performance Part 2", 
-                0x14: "Performance Part 3", 0x16: "Performance Part 4",
-                0x20: "Patch Common",
-                0x22: "Patch Part 1", 0x24: "Patch Part 2", 
-                0x26: "Patch Part 3", 0x28: "Patch Part 4",
-                0x60: "Rhythm Common"
-            }.get(part_type, f"Unknown (0x{part_type:02X})")
+            description = _PART_TYPE_DESC.get(part_type, f"Unknown (0x{part_type:02X})")
             
             # Check for rhythm parts (0x24-0x62 range we generated)
-            if 0x24 <= part_type <= 0x62:
+            if part_type in _RHYTHM_RANGE:
                 rhythm_part_num = part_type - 0x23
                 description = f"Rhythm Part {rhythm_part_num}"
             
-            print(f"  0x{part_type:02X}: {description} ({count} messages)")
+            out.append(f"  0x{part_type:02X}: {description} ({count} messages)")
+    
+    sys.stdout.write('\n'.join(out) + '\n')
 
 def main():
     """Main analysis function."""
@@ -13,10 +13,22 @@ from jv1080_manager import JV1080Manager
 from sysex_parser import SysExParser
 from preset_builder import PresetBuilder
 
+# orjson is optional; it serializes considerably faster than the stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+def _dumps_pretty(obj: Any) -> bytes:
+    """Serialize obj as indented JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
 def demonstrate_sysex_parsing():
     """Demonstrate parsing existing SysEx files."""
     logger.info("=== SysEx File Parsing Demo ===")
@@ -47,12 +59,10 @@ def demonstrate_sysex_parsing():
         except Exception as e:
             logger.error(f"  Error parsing {syx_file.name}: {e}")
 
-def demonstrate_preset_building():
+def demonstrate_preset_building(builder: PresetBuilder):
     """Demonstrate building custom presets."""
     logger.info("=== Preset Building Demo ===")
     
-    builder = PresetBuilder()
-    
     # Create a new performance preset
     logger.info("Creating new performance preset...")
     preset = builder.create_new_preset("DEMO LEAD", "performance")
@@ -87,7 +97,7 @@ def demonstrate_preset_building():
     
     return preset
 
-def demonstrate_preset_application(preset):
+def demonstrate_preset_application(builder: PresetBuilder, preset):
     """Demonstrate applying a preset to the JV-1080."""
     logger.info("=== Preset Application Demo ===")
     
@@ -95,8 +105,6 @@ def demonstrate_preset_application(preset):
         logger.warning("No preset to apply")
         return
     
-    builder = PresetBuilder()
-    
     # Get available ports
     available_ports = builder.manager.get_available_ports()
     if not available_ports:
@@ -119,8 +127,6 @@ def demonstrate_configuration_export():
     """Demonstrate exporting preset as Python configuration."""
     logger.info("=== Configuration Export Demo ===")
     
-    builder = PresetBuilder()
-    
     # Create a sample configuration
     config = {
         "preset_name": "EXPORTED_DEMO",
@@ -130,10 +136,7 @@ def demonstrate_configuration_export():
                 "EFX:Type": 5,
                 "EFX:Parameter 1": 64,
                 "EFX:Parameter 2": 100,
-                "Performance name 1": ord('D'),
-                "Performance name 2": ord('E'),
-                "Performance name 3": ord('M'),
-                "Performance name 4": ord('O'),
+                **{f"Performance name {i}": char for i, char in enumerate(b"DEMO", 1)},
             }
         },
         "metadata": {
@@ -149,10 +152,13 @@ def demonstrate_configuration_export():
     export_file = export_dir / "demo_config.py"
     
     try:
-        with open(export_file, 'w') as f:
-            f.write('#!/usr/bin/env python3\n')
-            f.write('"""\nExported JV-1080 Preset Configuration\n"""\n\n')
-            f.write(f'PRESET_CONFIG = {json.dumps(config, indent=4)}\n')
+        # Assemble the whole file in one buffer and write it in one call
+        buf = bytearray(b'#!/usr/bin/env python3\n'
+                        b'"""\nExported JV-1080 Preset Configuration\n"""\n\n'
+                        b'PRESET_CONFIG = ')
+        buf += _dumps_pretty(config)
+        buf += b'\n'
+        export_file.write_bytes(buf)
         
         logger.info(f"✓ Configuration exported to {export_file}")
     except Exception as e:
@@ -164,18 +170,21 @@ def main():
     logger.info("=" * 50)
     
     try:
+        # One builder (and its loaded YAML configuration) is shared by all demos
+        builder = PresetBuilder()
+        
         # Parse existing SysEx files
         demonstrate_sysex_parsing()
         
         print()  # Add spacing
         
         # Build custom presets
-        preset = demonstrate_preset_building()
+        preset = demonstrate_preset_building(builder)
         
         print()  # Add spacing
         
         # Apply preset to hardware
-        demonstrate_preset_application(preset)
+        demonstrate_preset_application(builder, preset)
         
         print()  # Add spacing
         
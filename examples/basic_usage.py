@@ -22,18 +22,15 @@ def main():
     print("Switching to Performance mode...")
     jv.switch_mode("performance", port)
     
-    # Set performance name to "BASIC EX"
+    # Set performance name to "BASIC EX" (all 12 characters in one message)
     print("Setting performance name...")
     performance_name = "BASIC EX"
-    for i, char in enumerate(performance_name.ljust(12)[:12]):
-        param_name = f"Performance name {i+1}"
-        jv.send_parameter('temp_performance_common', param_name, ord(char), port)
+    name_bytes = performance_name.ljust(12)[:12].encode('ascii')
+    jv.send_parameter_block('temp_performance_common', 'Performance name 1', name_bytes, port)
     
-    # Set some EFX parameters
+    # Set some EFX parameters (EFX:Type, Parameter 1 and 2 are consecutive)
     print("Setting EFX parameters...")
-    jv.send_parameter('temp_performance_common', 'EFX:Type', 5, port)  # Reverb
-    jv.send_parameter('temp_performance_common', 'EFX:Parameter 1', 64, port)
-    jv.send_parameter('temp_performance_common', 'EFX:Parameter 2', 100, port)
+    jv.send_parameter_block('temp_performance_common', 'EFX:Type', [5, 64, 100], port)  # Reverb
     
     print("Basic example completed successfully!")
 
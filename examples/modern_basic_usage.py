@@ -43,7 +43,8 @@ def main():
         # Set performance name using modern string handling
         logger.info("Setting performance name...")
         performance_name = "MOD DEMO"
-        if jv.set_performance_name(performance_name, port):
+        name_bytes = performance_name.ljust(12)[:12].encode('ascii')
+        if jv.send_parameter_block('temp_performance_common', 'Performance name 1', name_bytes, port):
             logger.info(f"Performance name set to: {performance_name}")
         else:
             logger.warning("Failed to set performance name")
@@ -57,15 +58,16 @@ def main():
             ('EFX:Parameter 3', 80, 'Setting reverb feedback')
         ]
         
-        for param_name, value, description in efx_configs:
+        # The EFX parameters sit at consecutive addresses, so they are sent
+        # together in a single SysEx message
+        for _, _, description in efx_configs:
             logger.info(description)
-            try:
-                if jv.send_parameter('temp_performance_common', param_name, value, port):
-                    logger.info(f"✓ {param_name} = {value}")
-                else:
-                    logger.warning(f"✗ Failed to set {param_name}")
-            except ValueError as e:
-                logger.error(f"Parameter validation error for {param_name}: {e}")
+        efx_values = [value for _, value, _ in efx_configs]
+        if jv.send_parameter_block('temp_performance_common', efx_configs[0][0], efx_values, port):
+            for param_name, value, _ in efx_configs:
+                logger.info(f"✓ {param_name} = {value}")
+        else:
+            logger.warning("✗ Failed to set EFX parameters")
         
         # Demonstrate parameter listing
         logger.info("Available parameters in temp_performance_common:")
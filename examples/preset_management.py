@@ -6,10 +6,8 @@ Shows how to create, save, and load presets.
 
 from preset_builder import PresetBuilder
 
-def create_sample_preset():
+def create_sample_preset(builder):
     """Create a sample preset."""
-    builder = PresetBuilder()
-    
     # Create new preset
     preset = builder.create_new_preset(
         name="Ambient Pad",
@@ -38,26 +36,20 @@ def main():
     
     # Create sample preset
     print("Creating sample preset...")
-    preset = create_sample_preset()
+    preset = create_sample_preset(builder)
     
-    # Save to JSON
+    # Save to JSON and export to Python back to back from the same preset
     print("Saving preset...")
     builder.save_preset(preset, "ambient_pad.json")
-    
-    # Export to Python
     print("Exporting to Python...")
     builder.export_preset_to_python(preset, "ambient_pad_preset.py")
     
-    # Load and apply
-    print("Loading preset...")
-    loaded_preset = builder.load_preset("ambient_pad.json")
-    
-    if loaded_preset:
-        port = builder.manager.select_midi_port()
-        if port:
-            print("Applying preset to JV-1080...")
-            success, total = builder.apply_preset_to_jv1080(loaded_preset, port)
-            print(f"Applied {success}/{total} parameters successfully!")
+    # Apply the in-memory preset; no need to load the JSON back first
+    port = builder.manager.select_midi_port()
+    if port:
+        print("Applying preset to JV-1080...")
+        success, total = builder.apply_preset_to_jv1080(preset, port)
+        print(f"Applied {success}/{total} parameters successfully!")
     
     print("Preset example completed!")
 
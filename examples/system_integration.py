@@ -4,8 +4,11 @@ System Integration Example
 Demonstrates how all components work together in a real-world scenario.
 """
 
+import json
 import logging
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Dict, Any
 
@@ -13,10 +16,25 @@ from jv1080_manager import JV1080Manager
 from sysex_parser import SysExParser
 from preset_builder import PresetBuilder
 
+# orjson is optional; it serializes considerably faster than the stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Directories already created by _ensure_dir during this run
+_DIRS_ENSURED = set()
+
+def _ensure_dir(directory: Path) -> None:
+    """Create directory (and parents) unless this run already did so."""
+    if directory not in _DIRS_ENSURED:
+        directory.mkdir(parents=True, exist_ok=True)
+        _DIRS_ENSURED.add(directory)
+
 class JV1080Session:
     """Integrated session manager for JV-1080 operations."""
     
@@ -107,7 +125,7 @@ class JV1080Session:
             
             # Save for later use
             preset_file = Path("presets") / "layered_demo.json"
-            preset_file.parent.mkdir(exist_ok=True)
+            _ensure_dir(preset_file.parent)
             self.builder.save_preset(preset, str(preset_file))
             logger.info(f"✓ Preset saved to {preset_file}")
         
@@ -141,14 +159,16 @@ class JV1080Session:
         }
         
         backup_dir = Path("presets") / "backups"
-        backup_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(backup_dir)
         
         backup_file = backup_dir / f"backup_{backup_data['timestamp']}.json"
         
         try:
-            import json
-            with open(backup_file, 'w') as f:
-                json.dump(backup_data, f, indent=2)
+            if orjson is not None:
+                backup_file.write_bytes(orjson.dumps(backup_data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(backup_file, 'w') as f:
+                    json.dump(backup_data, f, indent=2)
             
             logger.info(f"✓ Backup saved to {backup_file}")
             return True
@@ -166,46 +186,69 @@ class JV1080Session:
             logger.warning("No sysex_files directory found")
             return False
         
-        syx_files = list(sysex_dir.glob("*.syx"))
+        # scandir yields names and cached file types without building and
+        # stat-ing a Path per directory entry
+        with os.scandir(sysex_dir) as entries:
+            syx_files = [Path(entry.path) for entry in entries
+                         if entry.name.endswith('.syx') and entry.is_file()]
         if not syx_files:
             logger.warning("No .syx files found")
             return False
         
         processed_dir = Path("presets") / "batch_processed"
-        processed_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(processed_dir)
+        
+        # Files are independent and the work is mostly file I/O, so process
+        # them on a thread pool; the parser and builder keep no per-file state
+        batch = syx_files[:5]  # Process first 5 files
+        with ThreadPoolExecutor(max_workers=min(8, len(batch))) as executor:
+            futures = [executor.submit(self._process_syx_file, syx_file, processed_dir)
+                       for syx_file in batch]
+            success_count = sum(future.result() for future in as_completed(futures))
+        
+        logger.info(f"Batch processing complete: {success_count} files processed successfully")
+        return success_count > 0
+    
+    def _process_syx_file(self, syx_file: Path, processed_dir: Path) -> bool:
+        """Parse one .syx file and export it as JSON and Python presets."""
+        json_file = processed_dir / f"{syx_file.stem}.json"
+        py_file = processed_dir / f"{syx_file.stem}_config.py"
         
-        success_count = 0
+        # Skip files whose exports are already newer than the source
+        try:
+            exported_mtime = min(json_file.stat().st_mtime_ns, py_file.stat().st_mtime_ns)
+            if exported_mtime > syx_file.stat().st_mtime_ns:
+                logger.info(f"Up to date: {syx_file.name}")
+                return True
+        except FileNotFoundError:
+            pass
+        
+        logger.info(f"Processing: {syx_file.name}")
         
-        for syx_file in syx_files[:5]:  # Process first 5 files
-            logger.info(f"Processing: {syx_file.name}")
+        try:
+            # Parse SysEx file
+            parameters = self.parser.parse_sysex_file(str(syx_file))
+            
+            # Create preset from parameters
+            preset_name = syx_file.stem.upper()
+            preset = self.parser.create_preset_from_parameters(parameters, preset_name)
             
-            try:
-                # Parse SysEx file
-                parameters = self.parser.parse_sysex_file(str(syx_file))
+            if preset:
+                # Save as JSON
+                self.builder.save_preset(preset, str(json_file))
                 
-                # Create preset from parameters
-                preset_name = syx_file.stem.upper()
-                preset = self.parser.create_preset_from_parameters(parameters, preset_name)
+                # Export as Python config
+                self.parser.export_preset_to_python(preset, str(py_file))
                 
-                if preset:
-                    # Save as JSON
-                    json_file = processed_dir / f"{syx_file.stem}.json"
-                    self.builder.save_preset(preset, str(json_file))
-                    
-                    # Export as Python config
-                    py_file = processed_dir / f"{syx_file.stem}_config.py"
-                    self.parser.export_preset_to_python(preset, str(py_file))
-                    
-                    logger.info(f"  ✓ Processed and exported")
-                    success_count += 1
-                else:
-                    logger.warning(f"  ✗ Failed to create preset")
-                    
-            except Exception as e:
-                logger.error(f"  ✗ Error processing {syx_file.name}: {e}")
+                logger.info(f"  ✓ Processed and exported {syx_file.name}")
+                return True
+            else:
+                logger.warning(f"  ✗ Failed to create preset from {syx_file.name}")
+                
+        except Exception as e:
+            logger.error(f"  ✗ Error processing {syx_file.name}: {e}")
         
-        logger.info(f"Batch processing complete: {success_count} files processed successfully")
-        return success_count > 0
+        return False
 
 def main():
     """Run the complete system integration demonstration."""
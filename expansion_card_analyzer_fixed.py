@@ -4,13 +4,20 @@ JV-1080 Expansion Card SysEx Analyzer
 Focused analysis of Vintage and Techno expansion card SysEx files to validate parser functionality.
 """
 
+import json
 import logging
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, Any
 import sys
 from collections import defaultdict, Counter
 
-from sysex_parser import SysExParser, ParsedParameter, ParsedPreset
+from sysex_parser import SysExParser, ParsedPreset
+
+# orjson is optional; it serializes considerably faster than the stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure detailed logging
 logging.basicConfig(
@@ -18,35 +25,71 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
         logging.StreamHandler(sys.stdout),
-        logging.FileHandler('expansion_card_analysis.log')
+        logging.FileHandler('expansion_card_analysis.log', delay=True)
     ]
 )
 logger = logging.getLogger(__name__)
 
+# JV-1080 bank type for each possible first address byte (based on manual):
+# performance banks typically start with 01 xx xx, patch banks with 02 xx xx
+# or 03 xx xx and rhythm banks with 04 xx xx
+_BANK_TYPE_BY_FIRST_BYTE = tuple(
+    {0x01: 'performance', 0x02: 'patch', 0x03: 'patch', 0x04: 'rhythm'}.get(b, 'unknown')
+    for b in range(256)
+)
+
+# Analysis entries holding parameter objects, left out of the JSON report
+_NON_SERIALIZABLE_KEYS = frozenset({'raw_parameters', 'grouped_parameters'})
+
+# Directories already created by _ensure_dir during this run
+_DIRS_ENSURED = set()
+
+def _ensure_dir(directory: Path) -> None:
+    """Create directory (and parents) unless this run already did so."""
+    if directory not in _DIRS_ENSURED:
+        directory.mkdir(parents=True, exist_ok=True)
+        _DIRS_ENSURED.add(directory)
+
+def _dumps_line(obj: Any) -> bytes:
+    """Serialize obj as one compact JSON Lines record, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj) + b'\n'
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8') + b'\n'
+
 class ExpansionCardAnalyzer:
     """Analyzer for JV-1080 expansion card SysEx files."""
     
     def __init__(self):
         self.parser = SysExParser()
         self.results = {}
+        # Parsed parameters keyed by (path, mtime_ns, size), so a file that
+        # is analyzed again during the run is only re-parsed if it changed
+        self._parse_cache = {}
     
     def analyze_file(self, file_path: Path) -> Dict[str, Any]:
         """Analyze a single SysEx file and return detailed information."""
-        logger.info(f"[ANALYZING] {file_path.name}")
+        logger.info("[ANALYZING] %s", file_path.name)
         
         try:
-            # Parse the file
-            parameters = self.parser.parse_sysex_file(str(file_path))
-            
             # Get file size info
-            file_size = file_path.stat().st_size
+            stat = file_path.stat()
+            file_size = stat.st_size
+            
+            # Parse the file, reusing the result of an earlier parse
+            cache_key = (str(file_path), stat.st_mtime_ns, file_size)
+            parameters = self._parse_cache.get(cache_key)
+            if parameters is None:
+                parameters = self.parser.parse_sysex_file(str(file_path))
+                self._parse_cache[cache_key] = parameters
             
             # Group parameters by type
             grouped_params = self.parser.group_parameters_by_type(parameters)
             
-            # Analyze parameter distribution
+            # Analyze parameter distribution; Counter tallies generator input
+            # in C, which beats a Python loop doing `+= 1` per parameter
             param_groups = Counter(param.group_name for param in parameters)
-            unique_addresses = len(set(tuple(param.address) for param in parameters))
+            address_counts = Counter(param.address_key for param in parameters)
+            unique_addresses = len(address_counts)
             
             # Create analysis result
             analysis = {
@@ -60,56 +103,55 @@ class ExpansionCardAnalyzer:
             }
             
             # Detect card type and banks
-            card_info = self._detect_card_type(parameters, file_path.name)
+            card_info = self._detect_card_type(address_counts, file_path.name)
             analysis.update(card_info)
             
-            logger.info(f"[SUCCESS] {file_path.name}: {len(parameters)} parameters, {len(param_groups)} groups")
+            logger.info("[SUCCESS] %s: %d parameters, %d groups", file_path.name, len(parameters), len(param_groups))
             return analysis
             
         except Exception as e:
-            logger.error(f"[ERROR] Error analyzing {file_path.name}: {e}")
+            logger.error("[ERROR] Error analyzing %s: %s", file_path.name, e)
             return {
                 'file_name': file_path.name,
                 'error': str(e),
                 'total_parameters': 0
             }
     
-    def _detect_card_type(self, parameters: List[ParsedParameter], filename: str) -> Dict[str, Any]:
-        """Detect what type of card data this is (Performance, Patch, Rhythm)."""
-        
-        # Analyze address patterns to determine bank types
-        addresses = [tuple(param.address) for param in parameters]
-        address_patterns = Counter(addresses)
-        
-        # JV-1080 address mapping (based on manual)
-        bank_types = {
-            'performance': [],
-            'patch': [],
-            'rhythm': [],
-            'unknown': []
-        }
+    def _detect_card_type(self, address_counts: Counter, filename: str) -> Dict[str, Any]:
+        """Detect what type of card data this is (Performance, Patch, Rhythm).
         
-        for addr in addresses:
-            addr_hex = [f"{x:02X}" for x in addr]
-            addr_str = " ".join(addr_hex)
-            
-            # Performance banks typically start with 01 xx xx
-            if addr[0] == 0x01:
-                bank_types['performance'].append(addr)
-            # Patch banks typically start with 02 xx xx or 03 xx xx  
-            elif addr[0] in [0x02, 0x03]:
-                bank_types['patch'].append(addr)
-            # Rhythm banks typically start with 04 xx xx
-            elif addr[0] == 0x04:
-                bank_types['rhythm'].append(addr)
-            else:
-                bank_types['unknown'].append(addr)
+        address_counts maps each address (as ParsedParameter.address_key)
+        to the number of parameters found at it, so every distinct address
+        is classified only once.
+        """
+        
+        # Unique addresses and total parameters per bank type
+        unique_counts = {'performance': 0, 'patch': 0, 'rhythm': 0, 'unknown': 0}
+        total_counts = dict(unique_counts)
+        
+        # A dump of a single bank (the common case) has all its first address
+        # bytes in a range of one bank type; min/max of the bytes keys find
+        # that range in C, and the counts then follow without classifying
+        # each address
+        single_type = None
+        if address_counts:
+            low, high = min(address_counts)[0], max(address_counts)[0]
+            range_types = set(_BANK_TYPE_BY_FIRST_BYTE[low:high + 1])
+            if len(range_types) == 1:
+                single_type = range_types.pop()
+        
+        if single_type is not None:
+            logger.debug("%s: all addresses are in %s banks", filename, single_type)
+            unique_counts[single_type] = len(address_counts)
+            total_counts[single_type] = sum(address_counts.values())
+        else:
+            for addr, count in address_counts.items():
+                bank_type = _BANK_TYPE_BY_FIRST_BYTE[addr[0]]
+                unique_counts[bank_type] += 1
+                total_counts[bank_type] += count
         
         # Count unique addresses by type
-        detected_banks = {}
-        for bank_type, addrs in bank_types.items():
-            if addrs:
-                detected_banks[bank_type] = len(set(addrs))
+        detected_banks = {k: v for k, v in unique_counts.items() if v}
         
         # Determine primary card type
         if detected_banks:
@@ -120,7 +162,7 @@ class ExpansionCardAnalyzer:
         return {
             'detected_card_type': primary_type,
             'detected_banks': detected_banks,
-            'bank_distribution': {k: len(v) for k, v in bank_types.items() if v}
+            'bank_distribution': {k: v for k, v in total_counts.items() if v}
         }
     
     def analyze_vintage_and_techno_cards(self) -> Dict[str, Any]:
@@ -144,7 +186,7 @@ class ExpansionCardAnalyzer:
             if file_path.exists():
                 results[filename] = self.analyze_file(file_path)
             else:
-                logger.warning(f"[WARNING] File not found: {filename}")
+                logger.warning("[WARNING] File not found: %s", filename)
                 results[filename] = {'error': 'File not found'}
         
         # Generate summary report
@@ -155,9 +197,10 @@ class ExpansionCardAnalyzer:
     def _generate_summary_report(self, results: Dict[str, Any]) -> None:
         """Generate a comprehensive summary report."""
         
-        logger.info("\n" + "=" * 60)
-        logger.info("[SUMMARY] EXPANSION CARD ANALYSIS SUMMARY")
-        logger.info("=" * 60)
+        # Each section is emitted as one multi-line record rather than one
+        # record (and log file write) per line
+        logger.info("\n" + "=" * 60 + "\n[SUMMARY] EXPANSION CARD ANALYSIS SUMMARY\n" + "=" * 60)
+        log_info = logger.isEnabledFor(logging.INFO)
         
         total_params = 0
         total_files = 0
@@ -169,22 +212,27 @@ class ExpansionCardAnalyzer:
                 total_params += analysis['total_parameters']
                 card_types[analysis.get('detected_card_type', 'unknown')] += 1
                 
-                logger.info(f"\n[FILE] {filename}:")
-                logger.info(f"   Size: {analysis['file_size_bytes']:,} bytes")
-                logger.info(f"   Parameters: {analysis['total_parameters']}")
-                logger.info(f"   Unique Addresses: {analysis['unique_addresses']}")
-                logger.info(f"   Detected Type: {analysis.get('detected_card_type', 'unknown')}")
+                if not log_info:
+                    continue
+                
+                lines = [
+                    f"\n[FILE] {filename}:",
+                    f"   Size: {analysis['file_size_bytes']:,} bytes",
+                    f"   Parameters: {analysis['total_parameters']}",
+                    f"   Unique Addresses: {analysis['unique_addresses']}",
+                    f"   Detected Type: {analysis.get('detected_card_type', 'unknown')}",
+                ]
                 
                 if 'detected_banks' in analysis:
-                    logger.info(f"   Banks Found: {analysis['detected_banks']}")
+                    lines.append(f"   Banks Found: {analysis['detected_banks']}")
                 
                 if 'parameter_groups' in analysis:
-                    logger.info(f"   Parameter Groups: {analysis['parameter_groups']}")
+                    lines.append(f"   Parameter Groups: {analysis['parameter_groups']}")
+                
+                logger.info("\n".join(lines))
         
-        logger.info(f"\n[TOTALS]:")
-        logger.info(f"   Files Analyzed: {total_files}")
-        logger.info(f"   Total Parameters: {total_params}")
-        logger.info(f"   Card Types: {dict(card_types)}")
+        logger.info("\n[TOTALS]:\n   Files Analyzed: %d\n   Total Parameters: %d\n   Card Types: %s",
+                    total_files, total_params, dict(card_types))
         
         # Save detailed results
         self._save_detailed_results(results)
@@ -192,56 +240,53 @@ class ExpansionCardAnalyzer:
     def _save_detailed_results(self, results: Dict[str, Any]) -> None:
         """Save detailed analysis results to files."""
         
-        import json
-        
         # Save JSON report
         output_dir = Path("presets") / "analysis"
-        output_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(output_dir)
         
         json_file = output_dir / "expansion_card_analysis.json"
         
-        # Prepare JSON-serializable data
-        json_results = {}
-        for filename, analysis in results.items():
-            json_data = analysis.copy()
-            
-            # Remove non-serializable objects
-            if 'raw_parameters' in json_data:
-                del json_data['raw_parameters']
-            if 'grouped_parameters' in json_data:
-                del json_data['grouped_parameters']
-                
-            json_results[filename] = json_data
+        # Prepare JSON-serializable data, leaving out the parameter objects
+        json_results = {
+            filename: {key: value for key, value in analysis.items()
+                       if key not in _NON_SERIALIZABLE_KEYS}
+            for filename, analysis in results.items()
+        }
         
-        with open(json_file, 'w') as f:
-            json.dump(json_results, f, indent=2)
+        if orjson is not None:
+            json_file.write_bytes(orjson.dumps(json_results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(json_file, 'w') as f:
+                json.dump(json_results, f, indent=2)
         
-        logger.info(f"[SAVED] Detailed results saved to: {json_file}")
+        logger.info("[SAVED] Detailed results saved to: %s", json_file)
         
         # Save parameter details
         self._save_parameter_details(results, output_dir)
     
     def _save_parameter_details(self, results: Dict[str, Any], output_dir: Path) -> None:
-        """Save detailed parameter information for each file."""
+        """Save detailed parameter information for each file.
+        
+        Parameters are written as JSON Lines (one object per line), encoded
+        with orjson when it is installed.
+        """
         
         for filename, analysis in results.items():
             if 'raw_parameters' in analysis:
-                param_file = output_dir / f"{Path(filename).stem}_parameters.txt"
+                param_file = output_dir / f"{Path(filename).stem}_parameters.jsonl"
                 
-                with open(param_file, 'w') as f:
-                    f.write(f"Parameter Analysis for {filename}\n")
-                    f.write("=" * 50 + "\n\n")
-                    
+                with open(param_file, 'wb') as f:
                     for i, param in enumerate(analysis['raw_parameters']):
-                        f.write(f"Parameter {i+1}:\n")
-                        f.write(f"  Group: {param.group_name}\n")
-                        f.write(f"  Name: {param.parameter_name}\n")
-                        f.write(f"  Value: {param.value}\n")
-                        f.write(f"  Address: {[f'{x:02X}' for x in param.address]}\n")
-                        f.write(f"  Raw Message: {[f'{x:02X}' for x in param.raw_message]}\n")
-                        f.write("\n")
+                        f.write(_dumps_line({
+                            'index': i + 1,
+                            'group': param.group_name,
+                            'name': param.parameter_name,
+                            'value': param.value,
+                            'address': list(param.address),
+                            'raw_message': list(param.raw_message),
+                        }))
                 
-                logger.info(f"[SAVED] Parameter details saved: {param_file}")
+                logger.info("[SAVED] Parameter details saved: %s", param_file)
 
 def main():
     """Main function to run the expansion card analysis."""
@@ -261,13 +306,13 @@ def main():
         
         for filename, analysis in results.items():
             if 'error' in analysis:
-                logger.error(f"[FAILED] {filename}: {analysis['error']}")
+                logger.error("[FAILED] %s: %s", filename, analysis['error'])
                 validation_passed = False
             elif analysis['total_parameters'] == 0:
-                logger.warning(f"[WARNING] {filename}: No parameters parsed")
+                logger.warning("[WARNING] %s: No parameters parsed", filename)
                 validation_passed = False
             else:
-                logger.info(f"[PASSED] {filename}: Successfully parsed {analysis['total_parameters']} parameters")
+                logger.info("[PASSED] %s: Successfully parsed %s parameters", filename, analysis['total_parameters'])
         
         if validation_passed:
             logger.info("\n[SUCCESS] Parser validation PASSED - All files processed successfully!")
@@ -277,7 +322,7 @@ def main():
         return validation_passed
         
     except Exception as e:
-        logger.error(f"[CRITICAL] Analysis failed: {e}")
+        logger.error("[CRITICAL] Analysis failed: %s", e)
         return False
 
 if __name__ == "__main__":
@@ -3,23 +3,17 @@
 Fix line break issues in the YAML file where 'bytes: N' and '- name:' are on the same line.
 """
 
-import re
+from fix_yaml import apply_fixes, fix_line_breaks
 
 def fix_yaml_line_breaks(filepath):
     """Fix line break issues in YAML file."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Find all instances first
-    pattern = r'(\s+bytes:\s*\d+)\s+(-\s+name:)'
-    matches = re.findall(pattern, content)
-    print(f"Found {len(matches)} instances to fix")
-    
     # Fix pattern: bytes: N        - name: becomes bytes: N\n        - name:
-    fixed_content = re.sub(pattern, r'\1\n        \2', content)
+    count, = apply_fixes(filepath, [fix_line_breaks])
+    print(f"Found {count} instances to fix")
     
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(fixed_content)
+    if not count:
+        print(f"No line breaks to fix in {filepath}")
+        return
     
     print(f"Fixed line breaks in {filepath}")
 
@@ -1,19 +1,12 @@
-import re
-
-# Read the YAML file
-with open('roland_jv_1080_fixed.yaml', 'r', encoding='utf-8') as f:
-    content = f.read()
+from fix_yaml import apply_fixes, fix_negatives
 
 print("Fixing negative numbers...")
 
-# Fix negative numbers by adding quotes
-content = re.sub(r'min:\s*(-\d+)', r'min: "\1"', content)
-content = re.sub(r'max:\s*(-\d+)', r'max: "\1"', content)
-
-print("Writing fixed content...")
-
-# Write back the fixed content
-with open('roland_jv_1080_fixed.yaml', 'w', encoding='utf-8') as f:
-    f.write(content)
+# Fix negative numbers by adding quotes (min and max in one pass); the file
+# is only written back if anything was fixed
+count, = apply_fixes('roland_jv_1080_fixed.yaml', [fix_negatives])
 
-print("✅ Negative number formatting fixed!")
+if count:
+    print("✅ Negative number formatting fixed!")
+else:
+    print("✅ No negative numbers needed fixing")
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Combined YAML Fixer
+Applies the fixes of fix_line_breaks.py, fix_negatives.py and fix_orphaned_properties.py
+to the YAML file with a single read and a single write.
+"""
+
+import mmap
+import os
+import re
+import shutil
+from datetime import datetime
+
+# 'bytes: N' followed by '- name:' on the same line
+_PAT_BYTES_NAME = re.compile(rb'(\s+bytes:\s*\d+)\s+(-\s+name:)')
+
+# min/max values that are negative numbers
+_PAT_NEGATIVE = re.compile(rb'(min|max):\s*(-\d+)')
+
+# Lines that start a parameter entry ('- name:'), end one ('bytes:') or hold a
+# parameter's offset; every other line is skipped by the regex engine
+_PAT_ENTRY_LINES = re.compile(rb'^([^\S\n]*)(- name:|bytes:|offset_hex: )', re.MULTILINE)
+_PAT_OFFSET_HEX = re.compile(rb'offset_hex: "([^"]+)"')
+
+# An offset_hex line needs a '- name:' entry within this many lines above it
+_NAME_LOOKBACK = 5
+
+def fix_line_breaks(content):
+    """Split 'bytes: N        - name:' onto two lines; returns (content, count)."""
+    return _PAT_BYTES_NAME.subn(rb'\1\n        \2', content)
+
+def fix_negatives(content):
+    """Quote negative min/max values; returns (content, count)."""
+    return _PAT_NEGATIVE.subn(rb'\1: "\2"', content)
+
+def fix_orphaned_properties(content):
+    """Add '- name:' entries to orphaned parameter properties; returns (content, count)."""
+    # Single sweep over the entry lines, tracking the line numbers of the
+    # last '- name:' entry and the last two 'bytes:' entries seen
+    fixes_applied = 0
+    line_no = 0
+    last_pos = 0
+    last_name = None
+    last_bytes = prev_bytes = -1
+    
+    def fix_entry(match):
+        nonlocal fixes_applied, line_no, last_pos, last_name, last_bytes, prev_bytes
+        line_no += content[last_pos:match.start()].count(b'\n')
+        last_pos = match.start()
+        indent, key = match.groups()
+        
+        if key == b'- name:':
+            last_name = line_no
+            return match.group(0)
+        if key == b'bytes:':
+            prev_bytes, last_bytes = last_bytes, line_no
+            return match.group(0)
+        if indent != b'          ':
+            return match.group(0)
+        
+        # Properties belong to the '- name:' entry above them unless it is too
+        # far back or another parameter's 'bytes:' entry closed it in between
+        # (a 'bytes:' line directly above the offset_hex line does not count)
+        closing_bytes = last_bytes if last_bytes < line_no - 1 else prev_bytes
+        if (last_name is not None and last_name >= line_no - _NAME_LOOKBACK
+                and closing_bytes < last_name):
+            return match.group(0)
+        
+        # This looks like orphaned properties
+        # Try to determine what parameter this should be
+        line_end = content.find(b'\n', match.start())
+        line = content[match.start():line_end if line_end != -1 else len(content)]
+        offset_match = _PAT_OFFSET_HEX.search(line)
+        if not offset_match:
+            return match.group(0)
+        offset_hex = offset_match.group(1).decode('utf-8')
+        
+        # Generate a placeholder name based on offset
+        param_name = f"Parameter_{offset_hex}"
+        
+        # Add the missing name entry
+        fixes_applied += 1
+        print(f"Fixed orphaned properties at line {line_no + 1} with offset {offset_hex}")
+        return f"        - name: \"{param_name}\"\n".encode('utf-8') + match.group(0)
+    
+    fixed_content = _PAT_ENTRY_LINES.sub(fix_entry, content)
+    return fixed_content, fixes_applied
+
+def apply_fixes(filepath, fixers):
+    """
+    Run each fixer over the file contents in turn and write the result once.
+    
+    The patterns are ASCII, so the file is memory-mapped and scanned as bytes
+    without decoding it. The file is only rewritten, atomically through a
+    temporary file, if any fixer changed something.
+    
+    Returns:
+        The count reported by each fixer, in order
+    """
+    counts = []
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            content = b''  # mmap cannot map zero bytes
+            for fixer in fixers:
+                content, count = fixer(content)
+                counts.append(count)
+        else:
+            # The map is closed before the file is replaced
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                for fixer in fixers:
+                    content, count = fixer(content)
+                    counts.append(count)
+    
+    if any(counts):
+        tmp_path = f"{filepath}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_path, filepath)
+    
+    return counts
+
+def fix_yaml(filepath):
+    """Apply all fixes (line breaks, negatives, orphaned properties) to a YAML file."""
+    # Create backup
+    backup_path = f"{filepath}_backup_fix_{datetime.now().strftime('%Y%m%d_%H%M%S')}.yaml"
+    shutil.copy2(filepath, backup_path)
+    print(f"Created backup: {backup_path}")
+    
+    line_breaks, negatives, orphans = apply_fixes(
+        filepath, [fix_line_breaks, fix_negatives, fix_orphaned_properties])
+    
+    print(f"Fixed {line_breaks} line breaks")
+    print(f"Quoted {negatives} negative min/max values")
+    print(f"Applied {orphans} fixes for orphaned properties")
+    return line_breaks + negatives + orphans
+
+if __name__ == "__main__":
+    fixes = fix_yaml("roland_jv_1080_fixed.yaml")
+    print(f"YAML fixes completed: {fixes} fixes applied")
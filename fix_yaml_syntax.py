@@ -5,61 +5,119 @@ Fixes the specific syntax error at line 419 and validates the entire YAML struct
 """
 
 import yaml
+import mmap
+import os
 import re
 import sys
+from contextlib import contextmanager
 from pathlib import Path
 
+# Prefer the libyaml-backed C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+@contextmanager
+def _mapped(path):
+    """Yield the contents of a file as a read-only memory map."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''  # mmap cannot map zero bytes
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+# One whitespace character as str.strip() and str patterns' \s see it, other
+# than the newline, spelled out in UTF-8 since bytes patterns only know ASCII
+_WS = (rb'(?:[\t\x0b\x0c\r\x1c-\x1f ]|\xc2[\x85\xa0]|\xe1\x9a\x80'
+       rb'|\xe2\x80[\x80-\x8a\xa8\xa9\xaf]|\xe2\x81\x9f|\xe3\x80\x80)')
+
+# Lines that fix_yaml_syntax_errors may rewrite: parameters concatenated
+# after a 'bytes:' entry, unquoted parameter names and odd indentation. Every
+# other line is skipped by the regex engine instead of being checked in Python.
+# Non-ASCII bytes stand in for Unicode digits and word characters, so this
+# selects a superset of the lines fix_line changes.
+_PAT_FIX_LINES = re.compile(
+    rb'^(?:[^\n]*?bytes:' + _WS + rb'*(?:\d|[\x80-\xff])+' + _WS + rb'+- name:'
+    rb'|[^\n]*?- name:' + _WS + rb'+[^"\'\n](?:\w|[\x80-\xff])'
+    rb'|(?:' + _WS + _WS + rb')*' + _WS + rb'(?!' + _WS + rb')[^\n])[^\n]*',
+    re.MULTILINE)
+
+# Patterns fix_line applies to a decoded line
+_PAT_CONCAT = re.compile(r'bytes:\s*\d+\s+- name:')
+_PAT_NAME_SPLIT = re.compile(r'(\s+- name:)')
+_PAT_UNQUOTED_NAME = re.compile(r'(- name:\s+)([^"\']\w+)')
+
+# Sections and parameter fields validate_yaml_structure requires, in the
+# order they are reported, and as sets for checking them all at once
+_REQUIRED_SECTIONS = (
+    'expansion_patch_common',
+    'expansion_patch_part_1',
+    'expansion_patch_part_2',
+    'expansion_patch_part_3',
+    'expansion_patch_part_4',
+    'expansion_performance_part_1',
+    'expansion_performance_part_2',
+    'expansion_performance_part_3',
+    'expansion_performance_part_4',
+)
+_REQUIRED_SECTIONS_SET = frozenset(_REQUIRED_SECTIONS)
+_EXPECTED_RHYTHM_PARTS = frozenset(f'expansion_rhythm_part_{i}' for i in range(2, 65))
+_REQUIRED_PARAM_FIELDS = ('name', 'offset_hex', 'min', 'max', 'bytes')
+_REQUIRED_PARAM_FIELDS_SET = frozenset(_REQUIRED_PARAM_FIELDS)
+
 def fix_yaml_syntax_errors(yaml_file_path):
     """
     Fix known YAML syntax errors in the JV-1080 configuration file.
+    
+    The backup is created and the file rewritten only if a fix was applied
+    or its CRLF/CR line endings were normalized.
+    
+    Returns the fixed file contents as bytes.
     """
     print(f"🔧 Fixing YAML syntax errors in: {yaml_file_path}")
     
-    # Read the file
-    with open(yaml_file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-      # Create backup
-    backup_path = str(yaml_file_path).replace('.yaml', '_backup.yaml')
-    with open(backup_path, 'w', encoding='utf-8') as f:
-        f.write(content)
-    print(f"📦 Created backup: {backup_path}")
-    
-    # Split into lines for processing
-    lines = content.split('\n')
-    fixed_lines = []
+    line_no = 0
+    last_pos = 0
+    fixes_applied = 0
     
-    for i, line in enumerate(lines, 1):
+    def fix_line(match):
+        nonlocal line_no, last_pos, fixes_applied
+        line_no += content[last_pos:match.start()].count(b'\n')
+        last_pos = match.start()
+        i = line_no + 1
+        line = match.group(0).decode('utf-8')
+        
         # Fix the specific error at line 419: "bytes: 1        - name: "Chorus Level""
         if 'bytes: 1        - name:' in line:
             # Split this malformed line into two properly formatted lines
             parts = line.split('        - name:')
             if len(parts) == 2:
                 indent = len(line) - len(line.lstrip())
-                fixed_lines.append(parts[0])  # "bytes: 1"
-                fixed_lines.append(' ' * (indent - 8) + '- name:' + parts[1])  # Proper indentation for list item
+                fixes_applied += 1
                 print(f"🔧 Fixed malformed line {i}: Split into two lines")
-                continue
+                # "bytes: 1", then the list item with proper indentation
+                return f"{parts[0]}\n{' ' * (indent - 8)}- name:{parts[1]}".encode('utf-8')
         
         # Fix any other similar issues where parameters are concatenated
-        if re.search(r'bytes:\s*\d+\s+- name:', line):
-            parts = re.split(r'(\s+- name:)', line)
+        if _PAT_CONCAT.search(line):
+            parts = _PAT_NAME_SPLIT.split(line)
             if len(parts) >= 3:
                 indent = len(line) - len(line.lstrip())
-                # First part: the "bytes: X" portion
-                fixed_lines.append(parts[0])
-                # Second part: the "- name:" portion with proper indentation
+                # First part: the "bytes: X" portion, then the "- name:"
+                # portion with proper indentation
                 remaining = ''.join(parts[1:])
-                fixed_lines.append(' ' * (indent - 8) + remaining.strip())
+                fixes_applied += 1
                 print(f"🔧 Fixed concatenated parameters at line {i}")
-                continue
+                return f"{parts[0]}\n{' ' * (indent - 8)}{remaining.strip()}".encode('utf-8')
         
         # Fix missing quotes around parameter names
-        if re.search(r'- name:\s+[^"\']\w+', line):
-            fixed_line = re.sub(r'(- name:\s+)([^"\']\w+)', r'\1"\2"', line)
-            if fixed_line != line:
-                fixed_lines.append(fixed_line)
-                print(f"🔧 Added quotes to parameter name at line {i}")
-                continue
+        fixed_line, quoted = _PAT_UNQUOTED_NAME.subn(r'\1"\2"', line)
+        if quoted:
+            fixes_applied += 1
+            print(f"🔧 Added quotes to parameter name at line {i}")
+            return fixed_line.encode('utf-8')
         
         # Fix indentation issues (ensure consistent 2-space indentation)
         if line.strip():
@@ -67,50 +125,64 @@ def fix_yaml_syntax_errors(yaml_file_path):
             leading_spaces = len(line) - len(line.lstrip())
             if leading_spaces % 2 != 0 and leading_spaces > 0:
                 # Fix odd indentation by adding one space
-                line = ' ' + line
+                fixes_applied += 1
                 print(f"🔧 Fixed indentation at line {i}")
+                return b' ' + match.group(0)
         
-        fixed_lines.append(line)
+        return match.group(0)
     
-    # Join the fixed lines
-    fixed_content = '\n'.join(fixed_lines)
+    with _mapped(yaml_file_path) as original:
+        # Convert \r\n and lone \r line endings to \n, as reading the file
+        # in text mode would
+        content = original
+        if original.find(b'\r') != -1:
+            content = original[:].replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+        
+        # Only the lines matched by _PAT_FIX_LINES go through fix_line
+        fixed_content = _PAT_FIX_LINES.sub(fix_line, content)
+        
+        if not fixes_applied and content is original:
+            print(f"✅ No YAML syntax errors found in: {yaml_file_path}")
+            return fixed_content
+        
+        # Create backup straight from the mapped bytes
+        backup_path = str(yaml_file_path).replace('.yaml', '_backup.yaml')
+        with open(backup_path, 'wb') as f:
+            f.write(original)
+        print(f"📦 Created backup: {backup_path}")
     
-    # Write the fixed content back
-    with open(yaml_file_path, 'w', encoding='utf-8') as f:
+    # Write the fixed content back through a temporary file, once the map is
+    # closed, so the file is replaced atomically
+    tmp_path = f"{yaml_file_path}.tmp"
+    with open(tmp_path, 'wb') as f:
         f.write(fixed_content)
+    os.replace(tmp_path, yaml_file_path)
     
     print(f"✅ Fixed YAML syntax and saved to: {yaml_file_path}")
     return fixed_content
 
-def validate_yaml_structure(yaml_file_path):
+def validate_yaml_structure(yaml_file_path, content=None):
     """
     Validate the YAML structure and report any issues.
+    
+    If the file's contents are already in memory (e.g. as returned by
+    fix_yaml_syntax_errors), pass them as content to skip reading the file.
     """
     print(f"\n🔍 Validating YAML structure: {yaml_file_path}")
     
     try:
-        with open(yaml_file_path, 'r', encoding='utf-8') as f:
-            yaml_data = yaml.safe_load(f)
+        if content is not None:
+            yaml_data = yaml.load(content, Loader=_Loader)
+        else:
+            with _mapped(yaml_file_path) as mm:
+                yaml_data = yaml.load(mm, Loader=_Loader)
         
         print("✅ YAML syntax is valid!")
         
         # Validate required sections
-        required_sections = [
-            'expansion_patch_common',
-            'expansion_patch_part_1',
-            'expansion_patch_part_2', 
-            'expansion_patch_part_3',
-            'expansion_patch_part_4',
-            'expansion_performance_part_1',
-            'expansion_performance_part_2',
-            'expansion_performance_part_3',
-            'expansion_performance_part_4'
-        ]
-        
         missing_sections = []
-        for section in required_sections:
-            if section not in yaml_data:
-                missing_sections.append(section)
+        if not yaml_data.keys() >= _REQUIRED_SECTIONS_SET:
+            missing_sections = [section for section in _REQUIRED_SECTIONS if section not in yaml_data]
         
         if missing_sections:
             print(f"⚠️  Missing sections: {missing_sections}")
@@ -118,10 +190,7 @@ def validate_yaml_structure(yaml_file_path):
             print("✅ All required sections present!")
         
         # Validate rhythm parts (should have parts 2-64)
-        rhythm_parts = [key for key in yaml_data.keys() if key.startswith('expansion_rhythm_part_')]
-        expected_rhythm_parts = [f'expansion_rhythm_part_{i}' for i in range(2, 65)]
-        
-        missing_rhythm = [part for part in expected_rhythm_parts if part not in rhythm_parts]
+        missing_rhythm = _EXPECTED_RHYTHM_PARTS.difference(yaml_data)
         if missing_rhythm:
             print(f"⚠️  Missing rhythm parts: {len(missing_rhythm)} parts")
         else:
@@ -136,8 +205,10 @@ def validate_yaml_structure(yaml_file_path):
                         parameter_errors.append(f"{section_name}[{i}]: Parameter is not a dictionary")
                         continue
                     
-                    required_param_fields = ['name', 'offset_hex', 'min', 'max', 'bytes']
-                    for field in required_param_fields:
+                    # One set comparison for the usual complete parameter
+                    if param.keys() >= _REQUIRED_PARAM_FIELDS_SET:
+                        continue
+                    for field in _REQUIRED_PARAM_FIELDS:
                         if field not in param:
                             parameter_errors.append(f"{section_name}[{i}]: Missing '{field}' field")
         
@@ -183,7 +254,7 @@ def main():
         sys.exit(1)
     
     # Step 2: Validate structure
-    yaml_data, is_valid = validate_yaml_structure(yaml_file)
+    yaml_data, is_valid = validate_yaml_structure(yaml_file, fixed_content)
     
     if is_valid:
         print("\n🎉 YAML file is now valid and ready to use!")
@@ -4,12 +4,43 @@ This replaces the old INI-based RolandSysExManager and provides a clean, unified
 """
 
 import yaml
+import json
 import logging
+import os
+import pickle
+import struct
+import tempfile
 import time
-from typing import List, Dict, Union, Optional, Any
+from functools import lru_cache
+from typing import Iterable, List, Dict, Tuple, Union, Optional, Any
 from pathlib import Path
 import mido
 from mido import Message, open_output, get_output_names
+from mido.ports import BaseOutput
+
+# orjson is optional; it parses considerably faster than the stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Prefer the libyaml-backed C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# Header of the pickled config cache: st_mtime_ns and st_size of the YAML file
+# the cache was built from
+_CACHE_HEADER = struct.Struct('<qq')
+
+# Two-digit hex strings (either case) to their byte values; every address,
+# offset and ID in the config is one of these
+_HEX_BYTE = {f'{i:02X}': i for i in range(256)}
+_HEX_BYTE.update({f'{i:02x}': i for i in range(256)})
+
+# Set up logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 class JV1080Manager:
     """
@@ -17,6 +48,9 @@ class JV1080Manager:
     Provides full control over JV-1080 parameters and presets.
     """
     
+    __slots__ = ('config_path', 'config', 'common_info', 'parameter_groups', 'logger', 'delay',
+                 '_mfr', '_model', '_cmd_dt1', '_param_index', '_group_addr', '_build_cached')
+    
     def __init__(self, config_path: str = "roland_jv_1080_fixed.yaml"):
         """Initialize the JV-1080 Manager with YAML configuration."""
         self.config_path = Path(config_path)
@@ -24,32 +58,114 @@ class JV1080Manager:
         self.common_info = self.config['roland_jv_1080']['sysex_common_info']
         self.parameter_groups = self.config['roland_jv_1080']['sysex_parameter_groups']
         
-        # Set up logging
-        logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+        # Header bytes of DT1 messages
+        self._mfr = self._hex_to_int(self.common_info['manufacturer_id_hex'])
+        self._model = self._hex_to_int(self.common_info['model_id_hex'])
+        self._cmd_dt1 = self._hex_to_int(self.common_info['command_id_dt1_hex'])
+        
+        # (parameter, offset) by group and name, and the first three address
+        # bytes of each group, so messages are built without scanning the
+        # parameter lists or parsing hex strings. Groups are indexed by
+        # _index_group on first use, as most runs only touch a few of them.
+        self._param_index: Dict[str, Dict[str, Tuple[Dict[str, Any], int]]] = {}
+        self._group_addr: Dict[str, bytes] = {}
+        
+        # Built messages by (group, parameter, value, device ID); preset
+        # dumps send the same parameter values over and over
+        self._build_cached = lru_cache(maxsize=4096)(self._build_message)
+        
         self.logger = logging.getLogger(__name__)
         
         # Default delay between SysEx messages
         self.delay = 0.04
     
     def _load_config(self) -> Dict[str, Any]:
-        """Load YAML configuration file."""
+        """
+        Load YAML configuration file.
+        
+        A JSON copy of the config ('<name>.json', see scripts/yaml_to_json.py)
+        that is at least as new as the YAML file is loaded instead of it.
+        Otherwise the parsed config is pickled next to the YAML file
+        ('<name>.yaml.pkl') together with the YAML file's mtime and size;
+        while those still match, the pickle is loaded instead of parsing the
+        YAML again.
+        """
+        try:
+            stat = self.config_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
+        
+        json_path = self.config_path.with_suffix('.json')
+        try:
+            if json_path.stat().st_mtime_ns >= stat.st_mtime_ns:
+                content = json_path.read_bytes()
+                return orjson.loads(content) if orjson is not None else json.loads(content)
+        except FileNotFoundError:
+            pass
+        except ValueError as e:  # JSONDecodeError and orjson.JSONDecodeError
+            raise ValueError(f"Invalid JSON configuration {json_path}: {e}")
+        
+        key = _CACHE_HEADER.pack(stat.st_mtime_ns, stat.st_size)
+        cache_path = self.config_path.with_suffix(self.config_path.suffix + '.pkl')
+        try:
+            with open(cache_path, 'rb') as f:
+                if f.read(_CACHE_HEADER.size) == key:
+                    return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass  # No usable cache; parse the YAML
+        
         try:
             with open(self.config_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+                config = yaml.load(f, Loader=_Loader)
         except FileNotFoundError:
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML configuration: {e}")
+        
+        self._write_config_cache(cache_path, key, config)
+        return config
+    
+    def _write_config_cache(self, cache_path: Path, key: bytes, config: Dict[str, Any]) -> None:
+        """Atomically write the pickled config cache; failures only cost the next load a parse."""
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(key)
+                    pickle.dump(config, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            pass
+    
+    def _index_group(self, group_name: str) -> Optional[Dict[str, Tuple[Dict[str, Any], int]]]:
+        """Return the (parameter, offset) pairs of a group by name, indexing the group on first use."""
+        params = self._param_index.get(group_name)
+        if params is None and group_name in self.parameter_groups:
+            group = self.parameter_groups[group_name]
+            # reversed() lets the first of duplicate names win, as it did
+            # with a linear scan
+            params = self._param_index[group_name] = {
+                param['name']: (param, self._hex_to_int(param['offset_hex']))
+                for param in reversed(group['parameters'])
+            }
+            self._group_addr[group_name] = bytes(map(self._hex_to_int, group['address_bytes_1_3_hex']))
+        return params
     
     def _hex_to_int(self, hex_str: str) -> int:
         """Convert hex string to integer."""
-        return int(hex_str, 16)
+        value = _HEX_BYTE.get(hex_str)
+        return value if value is not None else int(hex_str, 16)
     
-    def _calculate_checksum(self, data: List[int]) -> int:
-        """Calculate Roland-style checksum."""
-        return (0x80 - (sum(data) % 0x80)) % 0x80
+    def _calculate_checksum(self, *parts: Iterable[int]) -> int:
+        """Calculate Roland-style checksum over one or more byte sequences (e.g. address, data)."""
+        # Same as (128 - sum % 128) % 128: C-level sum()s and a mask, without
+        # concatenating the parts
+        return (-sum(map(sum, parts))) & 0x7F
     
-    def build_sysex_message(self, group_name: str, parameter_name: str, value: Union[int, List[int]], device_id: str = "10") -> List[int]:
+    def build_sysex_message(self, group_name: str, parameter_name: str, value: Union[int, List[int]], device_id: str = "10") -> bytes:
         """
         Build a complete SysEx message for a parameter.
         
@@ -60,33 +176,27 @@ class JV1080Manager:
             device_id: Device ID in hex format (default "10")
         
         Returns:
-            Complete SysEx message as list of integers
+            Complete SysEx message as bytes
         """
-        if group_name not in self.parameter_groups:
+        # The cache needs a hashable value
+        if not isinstance(value, (int, bytes)):
+            value = tuple(value)
+        return self._build_cached(group_name, parameter_name, value, device_id)
+    
+    def _build_message(self, group_name: str, parameter_name: str, value: Union[int, bytes, Tuple[int, ...]], device_id: str) -> bytes:
+        """Build a SysEx message for build_sysex_message, which caches the result."""
+        group_params = self._index_group(group_name)
+        if group_params is None:
             raise ValueError(f"Unknown parameter group: {group_name}")
         
-        group = self.parameter_groups[group_name]
-        
         # Find the parameter
-        parameter = None
-        for param in group['parameters']:
-            if param['name'] == parameter_name:
-                parameter = param
-                break
-        
-        if parameter is None:
+        entry = group_params.get(parameter_name)
+        if entry is None:
             raise ValueError(f"Unknown parameter: {parameter_name} in group {group_name}")
-        
-        # Build message components
-        manufacturer_id = self._hex_to_int(self.common_info['manufacturer_id_hex'])
-        device_id_int = self._hex_to_int(device_id)
-        model_id = self._hex_to_int(self.common_info['model_id_hex'])
-        command_id = self._hex_to_int(self.common_info['command_id_dt1_hex'])
+        parameter, addr_4 = entry
         
         # Build address (Addr1, Addr2, Addr3, Addr4)
-        addr_1_3 = [self._hex_to_int(addr) for addr in group['address_bytes_1_3_hex']]
-        addr_4 = self._hex_to_int(parameter['offset_hex'])
-        address = addr_1_3 + [addr_4]
+        addr_1_3 = self._group_addr[group_name]
         
         # Prepare data
         if isinstance(value, int):
@@ -94,25 +204,78 @@ class JV1080Manager:
             if 'min' in parameter and 'max' in parameter:
                 if not (parameter['min'] <= value <= parameter['max']):
                     raise ValueError(f"Value {value} out of range [{parameter['min']}-{parameter['max']}] for {parameter_name}")
-            data = [value]
+            data = bytes((value,))
         else:
-            data = list(value)
+            data = bytes(value)
+        
+        # Build complete message in one buffer: F0 + manufacturer + device +
+        # model + command + address + data + checksum + F7, with the checksum
+        # over address + data
+        message = bytearray((0xF0, self._mfr, self._hex_to_int(device_id), self._model, self._cmd_dt1))
+        message += addr_1_3
+        message.append(addr_4)
+        message += data
+        message.append(self._calculate_checksum(addr_1_3, (addr_4,), data))
+        message.append(0xF7)
+        
+        return bytes(message)
+    
+    def build_parameter_block_message(self, group_name: str, start_parameter: str, values: List[int], device_id: str = "10") -> bytes:
+        """
+        Build a single SysEx message that writes consecutive parameters.
+        
+        Roland DT1 messages may carry several data bytes, which the JV-1080
+        writes to consecutive addresses starting at the message address. This
+        lets e.g. all 12 performance name characters share one message and
+        one checksum.
+        
+        Args:
+            group_name: Parameter group name (e.g., 'temp_performance_common')
+            start_parameter: Name of the parameter at the first address
+            values: Values for start_parameter and the parameters that follow it
+                (a bytes object, e.g. an ASCII-encoded name, works as well)
+            device_id: Device ID in hex format (default "10")
+        
+        Returns:
+            Complete SysEx message as bytes
+        """
+        if group_name not in self.parameter_groups:
+            raise ValueError(f"Unknown parameter group: {group_name}")
         
-        # Calculate checksum over address + data
-        checksum_data = address + data
-        checksum = self._calculate_checksum(checksum_data)
+        start_info = self.get_parameter_info(group_name, start_parameter)
+        if start_info is None:
+            raise ValueError(f"Unknown parameter: {start_parameter} in group {group_name}")
         
-        # Build complete message: F0 + manufacturer + device + model + command + address + data + checksum + F7
-        message = [0xF0, manufacturer_id, device_id_int, model_id, command_id] + address + data + [checksum, 0xF7]
+        # Validate every value against the parameter at its address
+        params_by_offset = {self._hex_to_int(param['offset_hex']): param
+                            for param in self.parameter_groups[group_name]['parameters']}
+        start_offset = self._hex_to_int(start_info['offset_hex'])
+        values = list(values)
+        for i, value in enumerate(values):
+            parameter = params_by_offset.get(start_offset + i)
+            if parameter is None:
+                raise ValueError(f"No parameter at offset {start_offset + i:02X} in group {group_name}")
+            if 'min' in parameter and 'max' in parameter:
+                if not (parameter['min'] <= value <= parameter['max']):
+                    raise ValueError(f"Value {value} out of range [{parameter['min']}-{parameter['max']}] for {parameter['name']}")
         
-        return message
+        return self.build_sysex_message(group_name, start_parameter, values, device_id)
     
     def get_available_ports(self) -> List[str]:
         """Get list of available MIDI output ports."""
         return get_output_names()
     
     def select_midi_port(self) -> Optional[str]:
-        """Interactive MIDI port selection."""
+        """
+        Interactive MIDI port selection.
+        
+        If the JV1080_PORT environment variable is set, its value is returned
+        without enumerating the MIDI ports, for scripted use.
+        """
+        port = os.environ.get('JV1080_PORT')
+        if port:
+            return port
+        
         ports = self.get_available_ports()
         if not ports:
             self.logger.error("No MIDI output ports found.")
@@ -132,30 +295,57 @@ class JV1080Manager:
         except (ValueError, KeyboardInterrupt):
             return None
     
-    def send_sysex(self, message: List[int], port_name: str) -> bool:
+    def send_sysex(self, message: Union[bytes, List[int]], port_name: Union[str, BaseOutput]) -> bool:
         """
         Send a SysEx message to the specified MIDI port.
         
         Args:
-            message: Complete SysEx message as list of integers
-            port_name: MIDI port name
+            message: Complete SysEx message as bytes or list of integers
+            port_name: MIDI port name, or an already open MIDI output port
         
         Returns:
             True if successful, False otherwise
         """
+        try:
+            if not isinstance(port_name, str):
+                return self._send_on_port(port_name, message)
+            with open_output(port_name) as port:
+                return self._send_on_port(port, message)
+        except Exception as e:
+            self.logger.error(f"Error sending SysEx: {e}")
+            return False
+    
+    def send_many(self, messages: Iterable[Union[bytes, List[int]]], port_name: str) -> bool:
+        """
+        Send several SysEx messages, opening the MIDI port only once.
+        
+        Args:
+            messages: Complete SysEx messages as bytes or lists of integers
+            port_name: MIDI port name
+        
+        Returns:
+            True if all messages were sent, False otherwise
+        """
         try:
             with open_output(port_name) as port:
-                # Strip F0 and F7 for mido (it adds them automatically)
-                sysex_data = message[1:-1]
-                port.send(Message('sysex', data=sysex_data))
-                self.logger.info(f"Sent SysEx: {[hex(x) for x in message]}")
-                time.sleep(self.delay)
+                for message in messages:
+                    self._send_on_port(port, message)
                 return True
         except Exception as e:
             self.logger.error(f"Error sending SysEx: {e}")
             return False
     
-    def send_parameter(self, group_name: str, parameter_name: str, value: Union[int, List[int]], port_name: str, device_id: str = "10") -> bool:
+    def _send_on_port(self, port: BaseOutput, message: Union[bytes, List[int]]) -> bool:
+        """Send a SysEx message on an open MIDI output port."""
+        # Strip F0 and F7 for mido (it adds them automatically)
+        sysex_data = message[1:-1]
+        port.send(Message('sysex', data=sysex_data))
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Sent SysEx: %s", bytes(message).hex(' '))
+        time.sleep(self.delay)
+        return True
+    
+    def send_parameter(self, group_name: str, parameter_name: str, value: Union[int, List[int]], port_name: str, device_id: str = "10", port: Optional[BaseOutput] = None) -> bool:
         """
         Send a parameter change to the JV-1080.
         
@@ -165,27 +355,69 @@ class JV1080Manager:
             value: Parameter value
             port_name: MIDI port name
             device_id: Device ID in hex format
+            port: Already open MIDI output port to send on instead of opening port_name
         
         Returns:
             True if successful, False otherwise
         """
         try:
             message = self.build_sysex_message(group_name, parameter_name, value, device_id)
+            if port is not None:
+                return self._send_on_port(port, message)
             return self.send_sysex(message, port_name)
         except Exception as e:
             self.logger.error(f"Error sending parameter {parameter_name}: {e}")
             return False
     
+    def send_parameters(self, items: Iterable[Tuple[str, str, Union[int, List[int]]]], port_name: str, device_id: str = "10") -> bool:
+        """
+        Send several parameter changes over one connection to the MIDI port.
+        
+        All messages are built before the port is opened, so an unknown
+        parameter or out-of-range value sends nothing.
+        
+        Args:
+            items: (group_name, parameter_name, value) tuples
+            port_name: MIDI port name
+            device_id: Device ID in hex format
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            messages = [self.build_sysex_message(group_name, parameter_name, value, device_id)
+                        for group_name, parameter_name, value in items]
+        except Exception as e:
+            self.logger.error(f"Error building parameter messages: {e}")
+            return False
+        return self.send_many(messages, port_name)
+    
+    def send_parameter_block(self, group_name: str, start_parameter: str, values: List[int], port_name: str, device_id: str = "10") -> bool:
+        """
+        Send values for consecutive parameters in one SysEx message.
+        
+        Args:
+            group_name: Parameter group name
+            start_parameter: Name of the parameter at the first address
+            values: Values for start_parameter and the parameters that follow it
+            port_name: MIDI port name
+            device_id: Device ID in hex format
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            message = self.build_parameter_block_message(group_name, start_parameter, values, device_id)
+            return self.send_sysex(message, port_name)
+        except Exception as e:
+            self.logger.error(f"Error sending parameter block from {start_parameter}: {e}")
+            return False
+    
     def get_parameter_info(self, group_name: str, parameter_name: str) -> Optional[Dict[str, Any]]:
         """Get information about a specific parameter."""
-        if group_name not in self.parameter_groups:
-            return None
-        
-        group = self.parameter_groups[group_name]
-        for param in group['parameters']:
-            if param['name'] == parameter_name:
-                return param
-        return None
+        group_params = self._index_group(group_name)
+        entry = group_params.get(parameter_name) if group_params is not None else None
+        return entry[0] if entry is not None else None
     
     def list_parameter_groups(self) -> List[str]:
         """Get list of all parameter groups."""
@@ -214,19 +446,18 @@ class JV1080Manager:
         mode_value = 1 if mode.lower() == 'performance' else 0
         
         # Build basic mode switch message (this is a simplified version)
-        manufacturer_id = self._hex_to_int(self.common_info['manufacturer_id_hex'])
-        device_id_int = self._hex_to_int(device_id)
-        model_id = self._hex_to_int(self.common_info['model_id_hex'])
-        command_id = self._hex_to_int(self.common_info['command_id_dt1_hex'])
         
         # Mode switch address (this may need adjustment based on your needs)
-        address = [0x00, 0x00, 0x00, 0x00]
-        data = [mode_value]
+        address = bytes(4)
+        data = bytes((mode_value,))
         
-        checksum = self._calculate_checksum(address + data)
-        message = [0xF0, manufacturer_id, device_id_int, model_id, command_id] + address + data + [checksum, 0xF7]
+        message = bytearray((0xF0, self._mfr, self._hex_to_int(device_id), self._model, self._cmd_dt1))
+        message += address
+        message += data
+        message.append(self._calculate_checksum(address, data))
+        message.append(0xF7)
         
-        return self.send_sysex(message, port_name)
+        return self.send_sysex(bytes(message), port_name)
 
 
 # Example usage and helper functions
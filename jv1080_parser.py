@@ -9,23 +9,45 @@ Implements complete Common block (offsets 0–71) and Tone block (offsets 0–57
 import os
 import sys
 import logging
+import mmap
 import argparse
 import statistics
 import yaml
 import json
 import re
-from typing import Any, List, Optional, Dict, Union
+import struct
+from typing import Any, List, Optional, Dict, Tuple, Union
 from dataclasses import dataclass, asdict
 from collections import Counter, defaultdict
+from functools import lru_cache
 
+# orjson is optional; it serializes considerably faster than the stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+# libyaml's emitter is much faster than the pure-Python one when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+
+# Byte views of the Common (offsets 0–71) and Tone (offsets 0–57) blocks
+_COMMON_STRUCT = struct.Struct('<72B')
+_TONE_STRUCT = struct.Struct('<58B')
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters get a plain dataclass
+_slotted_dataclass = dataclass(slots=True) if sys.version_info >= (3, 10) else dataclass
+
+
+@_slotted_dataclass
 class ParsedParameter:
     group_name: str
     parameter_name: str
     value: Any
-    address: List[int]
-    raw_message: List[int]
+    address: Tuple[int, ...]
+    raw_message: bytes
     patch_index: Optional[int] = None
     interpreted_value: Optional[str] = None
     value_range: Optional[str] = None
@@ -35,7 +57,7 @@ class ParsedParameter:
     command: Optional[int] = None
 
 
-@dataclass
+@_slotted_dataclass
 class ParsedPreset:
     name: str
     preset_type: str
@@ -58,157 +80,352 @@ class AnalysisResult:
     tone_usage_patterns: Dict[str, Any]
 
 
+def _dumps_pretty(obj: Any) -> bytes:
+    """Serialize obj as indented UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+# Characters not allowed in filenames, or a run of whitespace
+_PAT_UNSAFE_OR_SPACE = re.compile(r'[\\/:*?"<>|]|\s+')
+# Anything else that is not a word character, '-', '_' or '.'
+_PAT_NON_SAFE = re.compile(r'[^\w\-_.]')
+
+
 def sanitize_filename(name: str) -> str:
     """Sanitize a string to be safe for use as a filename or folder name."""
-    # Remove or replace characters not allowed in Windows, macOS, Linux filenames
-    # Windows: \\/:*?"<>|, also remove control chars
-    name = re.sub(r'[\\/:*?"<>|]', '_', name)
-    name = re.sub(r'\s+', '_', name)  # Replace whitespace with underscores
-    name = re.sub(r'[^\w\-_.]', '', name)  # Remove any other non-safe chars
+    # Replace characters not allowed in Windows, macOS, Linux filenames
+    # (Windows: \\/:*?"<>|) and runs of whitespace with underscores
+    name = _PAT_UNSAFE_OR_SPACE.sub('_', name)
+    name = _PAT_NON_SAFE.sub('', name)  # Remove any other non-safe chars, including control chars
     name = name.strip('._')  # Remove leading/trailing dots/underscores
     if not name:
         name = 'untitled'
     return name
 
 
+_CATEGORY_NAMES = {
+    0: "Piano", 1: "E.Piano", 2: "Organ", 3: "Accordion",
+    4: "Bell", 5: "Mallet", 6: "Choir", 7: "Voice",
+    8: "Sax", 9: "Brass", 10: "Reed", 11: "Pipe",
+    12: "Synth Lead", 13: "Synth Pad", 14: "Synth FX", 15: "Strings",
+    16: "Guitar", 17: "Bass", 18: "Plucked", 19: "Ethnic",
+    20: "Percussion", 21: "SFX", 22: "Drums", 23: "User"
+}
+
+_BANK_NAMES = {
+    0: "Preset A", 1: "Preset B", 2: "Preset C", 3: "Preset D",
+    4: "User", 5: "Card"
+}
+
+# Bank value → MIDI Bank Select (MSB, LSB)
+_BANK_TO_MSB_LSB = {
+    0: (80, 0),  # Preset A
+    1: (80, 1),  # Preset B
+    2: (80, 2),  # Preset C
+    3: (80, 3),  # Preset D
+    4: (87, 0),  # User
+    5: (86, 0),  # Card
+}
+
+
+# Interpreted strings for every byte value, indexed by the value
+_OVER_127 = tuple(f"{v}/127" for v in range(256))
+_OVER_99 = tuple(f"{v}/99" for v in range(100))
+_CENTERED_64 = tuple(f"{v - 64:+d}" if v != 64 else "0" for v in range(256))
+_PAN = tuple("Center" if v == 64 else (f"L{64 - v}" if v < 64 else f"R{v - 64}") for v in range(256))
+
+
+@lru_cache(maxsize=8192)
+def _interpret(group_name: str, param_name: str, value: Any) -> tuple[str, str]:
+    """Interpret a parameter value; returns (interpreted, value_range)."""
+    interpreted = str(value)
+    value_range = ""
+    # Byte values index the precomputed tables; anything else is formatted below
+    is_byte = isinstance(value, int) and 0 <= value <= 0xFF
+    
+    try:
+        if group_name == "Common":
+            if param_name == "category" and isinstance(value, int):
+                # built-in categories 0–31
+                if value <= 31:
+                    interpreted = _CATEGORY_NAMES.get(value, f"Unknown({value})")
+                    value_range = "0-31"
+                # expansion boards: 32 → SR-JV80-01, 33 → SR-JV80-02, … up to e.g. 50
+                elif 32 <= value <= 50:
+                    board_num = value - 31
+                    interpreted = f"SR-JV80-{board_num:02d}"
+                    value_range = "32-50 (expansion)"
+                else:
+                    interpreted = f"Unknown({value})"
+                    value_range = "0-31 + expansions"
+            elif param_name == "bank" and isinstance(value, int):
+                interpreted = _BANK_NAMES.get(value, f"Unknown({value})")
+                value_range = "0-5"
+            elif param_name in ["chorus_send", "reverb_send", "output_level"]:
+                interpreted = _OVER_127[value] if is_byte else f"{value}/127"
+                value_range = "0-127"
+            elif param_name in ["fine_tune", "transpose", "key_transpose"]:
+                # These are centered at 64
+                offset = value - 64
+                if is_byte:
+                    interpreted = _CENTERED_64[value]
+                else:
+                    interpreted = f"{offset:+d}" if offset != 0 else "0"
+                value_range = "0-127 (64=center)"
+            elif param_name == "pb_range":
+                interpreted = f"±{value} semitones"
+                value_range = "0-24"
+            elif param_name in ["portamento_switch", "tone_switch"]:
+                interpreted = "On" if value else "Off"
+                value_range = "0=Off, 1=On"
+            elif param_name.endswith("_rate") or param_name.endswith("_level"):
+                if is_byte:
+                    interpreted = _OVER_99[value] if value <= 99 else _OVER_127[value]
+                else:
+                    interpreted = f"{value}/99" if value <= 99 else f"{value}/127"
+                value_range = "0-99" if value <= 99 else "0-127"
+            elif param_name == "lfo2_dest" and isinstance(value, int):
+                # Bitmask interpretation
+                destinations = []
+                if value & 1: destinations.append("Pitch")
+                if value & 2: destinations.append("Filter") 
+                if value & 4: destinations.append("Amp")
+                interpreted = ", ".join(destinations) if destinations else "None"
+                value_range = "0-7 (bitmap)"
+                
+        elif group_name.startswith("Tone"):
+            if param_name == "waveform_bank":
+                interpreted = f"Bank {value}"
+                value_range = "0-63"
+            elif param_name == "waveform_number":
+                interpreted = f"Wave {value}"
+                value_range = "0-127"
+            elif param_name in ["coarse_tune", "fine_tune"]:
+                if param_name == "coarse_tune":
+                    offset = value - 64
+                    interpreted = f"{offset:+d} semitones"
+                    value_range = "0-127 (64=center)"
+                else:
+                    offset = value - 64
+                    interpreted = f"{offset:+d} cents"
+                    value_range = "0-127 (64=center)"
+            elif param_name == "pan":
+                if is_byte:
+                    interpreted = _PAN[value]
+                elif value == 64:
+                    interpreted = "Center"
+                elif value < 64:
+                    interpreted = f"L{64-value}"
+                else:
+                    interpreted = f"R{value-64}"
+                value_range = "0-127 (64=center)"
+            elif param_name in ["porta_switch", "lfo_key_sync", "poly_mono_switch"]:
+                interpreted = "On" if value else "Off"
+                value_range = "0=Off, 1=On"
+            elif param_name.endswith("_level") or param_name.endswith("_depth"):
+                interpreted = _OVER_127[value] if is_byte else f"{value}/127"
+                value_range = "0-127"
+                
+    except (ValueError, TypeError):
+        pass  # Keep default string representation
+        
+    return interpreted, value_range
+
+
 class SysExParser:
     """Parser for JV-1080 SysEx files."""
     
-    def __init__(self):
-        self.category_names = {
-            0: "Piano", 1: "E.Piano", 2: "Organ", 3: "Accordion",
-            4: "Bell", 5: "Mallet", 6: "Choir", 7: "Voice",
-            8: "Sax", 9: "Brass", 10: "Reed", 11: "Pipe",
-            12: "Synth Lead", 13: "Synth Pad", 14: "Synth FX", 15: "Strings",
-            16: "Guitar", 17: "Bass", 18: "Plucked", 19: "Ethnic",
-            20: "Percussion", 21: "SFX", 22: "Drums", 23: "User"
-        }
-        
-        self.bank_names = {
-            0: "Preset A", 1: "Preset B", 2: "Preset C", 3: "Preset D",
-            4: "User", 5: "Card"
-        }
+    # Common block layout: (name, offset, length, data_type)
+    _COMMON_LAYOUT = (
+        # 0–11: Patch Name (12 bytes ASCII, padded with 0x00 or spaces)
+        ("patch_name", 0, 12, "string"),
+
+        # 12: Category (0–31)
+        ("category", 12, 1, "int"),
+        # 13: Bank (0–1 for Preset A/B, etc.)
+        ("bank", 13, 1, "int"),
+        # 14: Patch Number (0–127)
+        ("patch_number", 14, 1, "int"),
+        # 15: PCM Bank Select (0–63)
+        ("pcm_bank", 15, 1, "int"),
+
+        # 16 is reserved/padding (always 0x00)
+
+        # 17: Chorus Send Level (0–127)
+        ("chorus_send", 17, 1, "int"),
+        # 18: Reverb Send Level (0–127)
+        ("reverb_send", 18, 1, "int"),
+        # 19: Output Level (0–127)
+        ("output_level", 19, 1, "int"),
+
+        # 20–23: LFO 1 Rate, Delay, PMD, AMD (each 0–99)
+        ("lfo1_rate", 20, 1, "int"),
+        ("lfo1_delay", 21, 1, "int"),
+        ("lfo1_pmd", 22, 1, "int"),
+        ("lfo1_amd", 23, 1, "int"),
+
+        # 24–28: LFO 2 Rate, Delay, Dest (bit flags), PMD, AMD
+        #   LFO2 Dest is a bitmask: bit0 = pitch, bit1 = filter, bit2 = amp (0–7)
+        ("lfo2_rate", 24, 1, "int"),
+        ("lfo2_delay", 25, 1, "int"),
+        ("lfo2_dest", 26, 1, "int"),
+        ("lfo2_pmd", 27, 1, "int"),
+        ("lfo2_amd", 28, 1, "int"),
+
+        # 29: Portamento Switch (0 = off, 1 = on)
+        ("portamento_switch", 29, 1, "int"),
+        # 30: Portamento Time (0–99)
+        ("portamento_time", 30, 1, "int"),
+
+        # 31: Pitch Bend Range (0–24 semitones)
+        ("pb_range", 31, 1, "int"),
+        # 32: Fine Tune (signed 0–99, center=64)
+        ("fine_tune", 32, 1, "int"),
+        # 33: Transpose (0–127, center=64)
+        ("transpose", 33, 1, "int"),
+
+        # 34–37: Pitch EG Rate 1–4 (each 0–99)
+        ("pitch_eg_rate", 34, 4, "array"),  # offsets 34,35,36,37
+
+        # 38–41: Pitch EG Level 1–4 (each 0–99)
+        ("pitch_eg_level", 38, 4, "array"),  # offsets 38,39,40,41
+
+        # 42–45: Filter EG Rate 1–4 (each 0–99)
+        ("filter_eg_rate", 42, 4, "array"),  # offsets 42,43,44,45
+
+        # 46–49: Filter EG Level 1–4 (each 0–99)
+        ("filter_eg_level", 46, 4, "array"),  # offsets 46,47,48,49
+
+        # 50–53: Amp EG Rate 1–4 (each 0–99)
+        ("amp_eg_rate", 50, 4, "array"),  # offsets 50,51,52,53
+
+        # 54–57: Amp EG Level 1–4 (each 0–99)
+        ("amp_eg_level", 54, 4, "array"),  # offsets 54,55,56,57
+
+        # 58: Filter Cutoff (0–127)
+        ("filter_cutoff", 58, 1, "int"),
+        # 59: Filter Resonance (0–127)
+        ("filter_resonance", 59, 1, "int"),
+
+        # 60: Filter EG Attack Velocity (0–127)
+        ("filter_eg_attack_vel", 60, 1, "int"),
+        # 61: Filter EG Release Velocity (0–127)
+        ("filter_eg_release_vel", 61, 1, "int"),
+
+        # 62: Velocity → Amp Depth (0–127)
+        ("velocity_to_amp_depth", 62, 1, "int"),
+
+        # 63–64: Key Range Low / High (0–127 each)
+        ("key_range_low", 63, 1, "int"),
+        ("key_range_high", 64, 1, "int"),
+
+        # 65–66: Velocity Range Low / High (0–127 each)
+        ("vel_range_low", 65, 1, "int"),
+        ("vel_range_high", 66, 1, "int"),
+
+        # 67: Aftertouch Depth (0–127)
+        ("aftertouch_depth", 67, 1, "int"),
+
+        # 68: Key Transpose (0–127, center=64)
+        ("key_transpose", 68, 1, "int"),
+
+        # 69: Portamento Curve (0-127 chooses curve shape)
+        ("portamento_curve", 69, 1, "int"),
+
+        # 70–73 are reserved/padding and typically always 0x00
+    )
+    
+    # Tone block layout: (name, offset, length, data_type)
+    _TONE_LAYOUT = (
+        ("tone_switch", 0, 1, "int"),
+        ("waveform_bank", 1, 1, "int"),
+        ("waveform_number", 2, 1, "int"),
+        ("coarse_tune", 3, 1, "int"),
+        ("fine_tune", 4, 1, "int"),
+        ("key_group", 5, 1, "int"),
+        ("key_range_low", 6, 1, "int"),
+        ("key_range_high", 7, 1, "int"),
+        ("vel_range_low", 8, 1, "int"),
+        ("vel_range_high", 9, 1, "int"),
+        ("output_level", 10, 1, "int"),
+        ("pan", 11, 1, "int"),
+        ("porta_switch", 12, 1, "int"),
+        ("porta_time", 13, 1, "int"),
+        ("pitch_eg_rate", 14, 4, "array"),
+        ("pitch_eg_level", 18, 4, "array"),
+        ("filter_eg_rate", 22, 4, "array"),
+        ("filter_eg_level", 26, 4, "array"),
+        ("amp_eg_rate", 30, 4, "array"),
+        ("amp_eg_level", 34, 4, "array"),
+        ("filter_cutoff", 38, 1, "int"),
+        ("filter_resonance", 39, 1, "int"),
+        ("filter_eg_attack_vel", 40, 1, "int"),
+        ("filter_eg_release_vel", 41, 1, "int"),
+        ("lfo_pmd_depth", 42, 1, "int"),
+        ("lfo_amd_depth", 43, 1, "int"),
+        ("lfo_key_sync", 44, 1, "int"),
+        ("key_to_level_depth", 45, 1, "int"),
+        ("key_num_detune_depth", 46, 1, "int"),
+        ("key_follow", 47, 1, "int"),
+        ("ams_depth", 48, 1, "int"),
+        ("pms_depth", 49, 1, "int"),
+        ("pitch_bend_range", 50, 1, "int"),
+        ("aftertouch_depth", 51, 1, "int"),
+        ("poly_mono_switch", 52, 1, "int"),
+        ("unison_detune", 53, 1, "int"),
+        ("unison_pan_spread", 54, 1, "int"),
+        ("resonance_mod_depth", 55, 1, "int"),
+    )
     
     def _interpret_parameter_value(self, group_name: str, param_name: str, value: Any) -> tuple[str, str]:
         """Interpret parameter values into human-readable format."""
-        interpreted = str(value)
-        value_range = ""
-        
-        try:
-            if group_name == "Common":
-                if param_name == "category" and isinstance(value, int):
-                    # built-in categories 0–31
-                    if value <= 31:
-                        interpreted = self.category_names.get(value, f"Unknown({value})")
-                        value_range = "0-31"
-                    # expansion boards: 32 → SR-JV80-01, 33 → SR-JV80-02, … up to e.g. 50
-                    elif 32 <= value <= 50:
-                        board_num = value - 31
-                        interpreted = f"SR-JV80-{board_num:02d}"
-                        value_range = "32-50 (expansion)"
-                    else:
-                        interpreted = f"Unknown({value})"
-                        value_range = "0-31 + expansions"
-                elif param_name == "bank" and isinstance(value, int):
-                    interpreted = self.bank_names.get(value, f"Unknown({value})")
-                    value_range = "0-5"
-                elif param_name in ["chorus_send", "reverb_send", "output_level"]:
-                    interpreted = f"{value}/127"
-                    value_range = "0-127"
-                elif param_name in ["fine_tune", "transpose", "key_transpose"]:
-                    # These are centered at 64
-                    offset = value - 64
-                    interpreted = f"{offset:+d}" if offset != 0 else "0"
-                    value_range = "0-127 (64=center)"
-                elif param_name == "pb_range":
-                    interpreted = f"±{value} semitones"
-                    value_range = "0-24"
-                elif param_name in ["portamento_switch", "tone_switch"]:
-                    interpreted = "On" if value else "Off"
-                    value_range = "0=Off, 1=On"
-                elif param_name.endswith("_rate") or param_name.endswith("_level"):
-                    interpreted = f"{value}/99" if value <= 99 else f"{value}/127"
-                    value_range = "0-99" if value <= 99 else "0-127"
-                elif param_name == "lfo2_dest" and isinstance(value, int):
-                    # Bitmask interpretation
-                    destinations = []
-                    if value & 1: destinations.append("Pitch")
-                    if value & 2: destinations.append("Filter") 
-                    if value & 4: destinations.append("Amp")
-                    interpreted = ", ".join(destinations) if destinations else "None"
-                    value_range = "0-7 (bitmap)"
-                    
-            elif group_name.startswith("Tone"):
-                if param_name == "waveform_bank":
-                    interpreted = f"Bank {value}"
-                    value_range = "0-63"
-                elif param_name == "waveform_number":
-                    interpreted = f"Wave {value}"
-                    value_range = "0-127"
-                elif param_name in ["coarse_tune", "fine_tune"]:
-                    if param_name == "coarse_tune":
-                        offset = value - 64
-                        interpreted = f"{offset:+d} semitones"
-                        value_range = "0-127 (64=center)"
-                    else:
-                        offset = value - 64
-                        interpreted = f"{offset:+d} cents"
-                        value_range = "0-127 (64=center)"
-                elif param_name == "pan":
-                    if value == 64:
-                        interpreted = "Center"
-                    elif value < 64:
-                        interpreted = f"L{64-value}"
-                    else:
-                        interpreted = f"R{value-64}"
-                    value_range = "0-127 (64=center)"
-                elif param_name in ["porta_switch", "lfo_key_sync", "poly_mono_switch"]:
-                    interpreted = "On" if value else "Off"
-                    value_range = "0=Off, 1=On"
-                elif param_name.endswith("_level") or param_name.endswith("_depth"):
-                    interpreted = f"{value}/127"
-                    value_range = "0-127"
-                    
-        except (ValueError, TypeError):
-            pass  # Keep default string representation
-            
-        return interpreted, value_range
+        if isinstance(value, list):
+            # Array values are unhashable, so they bypass the cache
+            return _interpret.__wrapped__(group_name, param_name, value)
+        return _interpret(group_name, param_name, value)
     
     def parse_sysex_file(self, file_path: str) -> List[ParsedParameter]:
         """Parse a .syx file and return all parameters."""
         parameters = []
+        msg_count = 0
         
+        # Scan the mapped file in place; only the messages are copied out.
+        # mmap cannot map zero bytes, so an empty file is scanned as b''
         with open(file_path, 'rb') as f:
-            data = f.read()
+            if os.fstat(f.fileno()).st_size:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                data = b''
         
         logging.info(f"Loaded {len(data)} bytes from {file_path}")
         
-        i = 0
-        msg_count = 0
-        while i < len(data):
-            # Look for SysEx start (F0)
-            if data[i] != 0xF0:
-                i += 1
-                continue
+        try:
+            i = 0
+            while True:
+                # Look for SysEx start (F0)
+                start = data.find(b'\xF0', i)
+                if start == -1:
+                    break
                 
-            # Find the end of this SysEx message (F7)
-            start = i
-            end = start + 1
-            while end < len(data) and data[end] != 0xF7:
-                end += 1
-            
-            if end >= len(data):
-                break  # No F7 found
+                # Find the end of this SysEx message (F7)
+                end = data.find(b'\xF7', start + 1)
+                if end == -1:
+                    break  # No F7 found
                 
-            # Extract the complete SysEx message (including F0 and F7)
-            sysex_msg = data[start:end + 1]
-            msg_count += 1
-            
-            # Parse this SysEx message
-            msg_params = self._parse_sysex_message(sysex_msg)
-            parameters.extend(msg_params)
-            
-            i = end + 1
+                # Extract the complete SysEx message (including F0 and F7)
+                sysex_msg = data[start:end + 1]
+                msg_count += 1
+                
+                # Parse this SysEx message
+                msg_params = self._parse_sysex_message(sysex_msg)
+                parameters.extend(msg_params)
+                
+                i = end + 1
+        finally:
+            if isinstance(data, mmap.mmap):
+                data.close()
             
         logging.info(f"Processed {msg_count} SysEx messages, found {len(parameters)} parameters")
         return parameters
@@ -219,18 +436,19 @@ class SysExParser:
             return []
 
         # must be Roland JV-1080 header
-        if sysex_msg[:5] != b'\xF0\x41\x10\x6A\x12':
+        if not sysex_msg.startswith(b'\xF0\x41\x10\x6A\x12'):
             return []
 
-        addr_h, addr_m, addr_l = sysex_msg[5], sysex_msg[6], sysex_msg[7]
-        address = [addr_h, addr_m, addr_l]
-        payload = sysex_msg[8:-1]
-
         # skip SR-JV80 bank-select messages (00 xx 20) or any non-dump
+        addr_h = sysex_msg[5]
         if addr_h not in (0x11, 0x03):
-            logging.debug(f"Skipping non-dump Sysex (addr {addr_h:02X} {addr_m:02X} {addr_l:02X})")
+            logging.debug(f"Skipping non-dump Sysex (addr {addr_h:02X} {sysex_msg[6]:02X} {sysex_msg[7]:02X})")
             return []
 
+        addr_m, addr_l = sysex_msg[6], sysex_msg[7]
+        address = (addr_h, addr_m, addr_l)  # immutable, shared by every parameter of this message
+        payload = sysex_msg[8:-1]
+
         # … now your existing 0x11 and 0x03 parsing branches …
         # Handle 0x11 addresses (the actual format in our file)
         if addr_h == 0x11 and addr_l == 0x00:  # Common blocks: 11 XX 00
@@ -266,8 +484,8 @@ class SysExParser:
                     group_name=group,
                     parameter_name=f"param_{param_id}",
                     value=value,
-                    address=address.copy(),
-                    raw_message=list(sysex_msg)
+                    address=address,
+                    raw_message=sysex_msg
                 )
                 return [param]
             return []
@@ -277,7 +495,7 @@ class SysExParser:
         logging.debug(f"Unknown block type: {addr_h:02X} {addr_m:02X} {addr_l:02X}")
         return []
     
-    def _parse_common_block(self, payload: bytes, address: List[int], raw_message: bytes) -> List[ParsedParameter]:
+    def _parse_common_block(self, payload: bytes, address: Tuple[int, ...], raw_message: bytes) -> List[ParsedParameter]:
         """
         Parse a 'Common' block payload (must be ≥ 72 bytes).
         Uses known offsets for each Common parameter.
@@ -288,137 +506,37 @@ class SysExParser:
             logging.warning(f"Common block payload too short: {len(payload)} bytes")
             return parameters
 
-        # Complete mapping of offsets → (length, data_type) for Common block
-        common_params = {
-            # 0–11: Patch Name (12 bytes ASCII, padded with 0x00 or spaces)
-            "patch_name":          (0,  12, "string"),
-
-            # 12: Category (0–31)
-            "category":            (12, 1,  "int"),
-            # 13: Bank (0–1 for Preset A/B, etc.)
-            "bank":                (13, 1,  "int"),
-            # 14: Patch Number (0–127)
-            "patch_number":        (14, 1,  "int"),
-            # 15: PCM Bank Select (0–63)
-            "pcm_bank":            (15, 1,  "int"),
-
-            # 16 is reserved/padding (always 0x00)
-
-            # 17: Chorus Send Level (0–127)
-            "chorus_send":         (17, 1,  "int"),
-            # 18: Reverb Send Level (0–127)
-            "reverb_send":         (18, 1,  "int"),
-            # 19: Output Level (0–127)
-            "output_level":        (19, 1,  "int"),
-
-            # 20–23: LFO 1 Rate, Delay, PMD, AMD (each 0–99)
-            "lfo1_rate":           (20, 1,  "int"),
-            "lfo1_delay":          (21, 1,  "int"),
-            "lfo1_pmd":            (22, 1,  "int"),
-            "lfo1_amd":            (23, 1,  "int"),
-
-            # 24–28: LFO 2 Rate, Delay, Dest (bit flags), PMD, AMD
-            #   LFO2 Dest is a bitmask: bit0 = pitch, bit1 = filter, bit2 = amp (0–7)
-            "lfo2_rate":           (24, 1,  "int"),
-            "lfo2_delay":          (25, 1,  "int"),
-            "lfo2_dest":           (26, 1,  "int"),
-            "lfo2_pmd":            (27, 1,  "int"),
-            "lfo2_amd":            (28, 1,  "int"),
-
-            # 29: Portamento Switch (0 = off, 1 = on)
-            "portamento_switch":   (29, 1,  "int"),
-            # 30: Portamento Time (0–99)
-            "portamento_time":     (30, 1,  "int"),
-
-            # 31: Pitch Bend Range (0–24 semitones)
-            "pb_range":            (31, 1,  "int"),
-            # 32: Fine Tune (signed 0–99, center=64)
-            "fine_tune":           (32, 1,  "int"),
-            # 33: Transpose (0–127, center=64)
-            "transpose":           (33, 1,  "int"),
-
-            # 34–37: Pitch EG Rate 1–4 (each 0–99)
-            "pitch_eg_rate":       (34, 4,  "array"),  # offsets 34,35,36,37
-
-            # 38–41: Pitch EG Level 1–4 (each 0–99)
-            "pitch_eg_level":      (38, 4,  "array"),  # offsets 38,39,40,41
-
-            # 42–45: Filter EG Rate 1–4 (each 0–99)
-            "filter_eg_rate":      (42, 4,  "array"),  # offsets 42,43,44,45
-
-            # 46–49: Filter EG Level 1–4 (each 0–99)
-            "filter_eg_level":     (46, 4,  "array"),  # offsets 46,47,48,49
-
-            # 50–53: Amp EG Rate 1–4 (each 0–99)
-            "amp_eg_rate":         (50, 4,  "array"),  # offsets 50,51,52,53
-
-            # 54–57: Amp EG Level 1–4 (each 0–99)
-            "amp_eg_level":        (54, 4,  "array"),  # offsets 54,55,56,57
-
-            # 58: Filter Cutoff (0–127)
-            "filter_cutoff":       (58, 1,  "int"),
-            # 59: Filter Resonance (0–127)
-            "filter_resonance":    (59, 1,  "int"),
-
-            # 60: Filter EG Attack Velocity (0–127)
-            "filter_eg_attack_vel":  (60, 1, "int"),
-            # 61: Filter EG Release Velocity (0–127)
-            "filter_eg_release_vel": (61, 1, "int"),
-
-            # 62: Velocity → Amp Depth (0–127)
-            "velocity_to_amp_depth": (62, 1, "int"),
-
-            # 63–64: Key Range Low / High (0–127 each)
-            "key_range_low":       (63, 1,  "int"),
-            "key_range_high":      (64, 1,  "int"),
-
-            # 65–66: Velocity Range Low / High (0–127 each)
-            "vel_range_low":       (65, 1,  "int"),
-            "vel_range_high":      (66, 1,  "int"),
-
-            # 67: Aftertouch Depth (0–127)
-            "aftertouch_depth":    (67, 1,  "int"),
-
-            # 68: Key Transpose (0–127, center=64)
-            "key_transpose":       (68, 1,  "int"),            # 69: Portamento Curve (0-127 chooses curve shape)
-            "portamento_curve":    (69, 1,  "int"),
-
-            # 70–73 are reserved/padding and typically always 0x00
-        }
-
-        # Extract each defined parameter from payload
-        for param_name, (offset, length, data_type) in common_params.items():
-            if offset + length <= len(payload):
-                if data_type == "string":
-                    raw_bytes = payload[offset : offset + length]
-                   # strip both NULs and spaces; assume 12-byte fixed name field
-                    value = raw_bytes.decode("ascii", errors="ignore").strip("\x00 ")
-                elif data_type == "array":
-                    value = list(payload[offset : offset + length])
-                else:  # data_type == "int"
-                    value = int(payload[offset])
-
-                # Get interpreted value
-                interpreted_value, value_range = self._interpret_parameter_value("Common", param_name, value)
-
-                param = ParsedParameter(
-                    group_name="Common",
-                    parameter_name=param_name,
-                    value=value,
-                    address=address.copy(),
-                    raw_message=list(raw_message),
-                    interpreted_value=interpreted_value,
-                    value_range=value_range,
-                    manufacturer=raw_message[1],
-                    device_id=raw_message[2],
-                    model_id=raw_message[3],
-                    command=raw_message[4]
-                )
-                parameters.append(param)
+        # manufacturer, device_id, model_id and command are the same for every parameter
+        header = tuple(raw_message[1:5])
+
+        # Unpack the whole block into ints with a single call
+        block = _COMMON_STRUCT.unpack_from(payload)
+
+        # Extract each defined parameter from payload; the length check above
+        # already covers every offset in the layout
+        for param_name, offset, length, data_type in self._COMMON_LAYOUT:
+            if data_type == "string":
+                raw_bytes = payload[offset : offset + length]
+                # strip both NULs and spaces; assume 12-byte fixed name field
+                value = raw_bytes.decode("ascii", errors="ignore").strip("\x00 ")
+            elif data_type == "array":
+                value = list(block[offset : offset + length])
+            else:  # data_type == "int"
+                value = block[offset]
+
+            # Get interpreted value
+            interpreted_value, value_range = self._interpret_parameter_value("Common", param_name, value)
+
+            # Positional in field order: group_name, parameter_name, value, address,
+            # raw_message, patch_index, interpreted_value, value_range, then the header
+            parameters.append(ParsedParameter(
+                "Common", param_name, value, address, raw_message, None,
+                interpreted_value, value_range, *header
+            ))
 
         return parameters
 
-    def _parse_tone_block(self, payload: bytes, address: List[int], raw_message: bytes) -> List[ParsedParameter]:
+    def _parse_tone_block(self, payload: bytes, address: Tuple[int, ...], raw_message: bytes) -> List[ParsedParameter]:
         """
         Parse a 'Tone' block payload (must be ≥ 58 bytes).
         Uses known offsets for each Tone parameter.
@@ -429,144 +547,79 @@ class SysExParser:
             logging.warning(f"Tone block payload too short: {len(payload)} bytes")
             return parameters
 
-        # Complete mapping of offsets for Tone block
-        tone_params = {
-            "tone_switch":         (0,  1, "int"),
-            "waveform_bank":       (1,  1, "int"),
-            "waveform_number":     (2,  1, "int"),
-            "coarse_tune":         (3,  1, "int"),
-            "fine_tune":           (4,  1, "int"),
-            "key_group":           (5,  1, "int"),
-            "key_range_low":       (6,  1, "int"),
-            "key_range_high":      (7,  1, "int"),
-            "vel_range_low":       (8,  1, "int"),
-            "vel_range_high":      (9,  1, "int"),
-            "output_level":        (10, 1, "int"),
-            "pan":                 (11, 1, "int"),
-            "porta_switch":        (12, 1, "int"),
-            "porta_time":          (13, 1, "int"),
-            "pitch_eg_rate":       (14, 4, "array"),
-            "pitch_eg_level":      (18, 4, "array"),
-            "filter_eg_rate":      (22, 4, "array"),
-            "filter_eg_level":     (26, 4, "array"),
-            "amp_eg_rate":         (30, 4, "array"),
-            "amp_eg_level":        (34, 4, "array"),
-            "filter_cutoff":       (38, 1, "int"),
-            "filter_resonance":    (39, 1, "int"),
-            "filter_eg_attack_vel":(40, 1, "int"),
-            "filter_eg_release_vel":(41,1, "int"),
-            "lfo_pmd_depth":       (42, 1, "int"),
-            "lfo_amd_depth":       (43, 1, "int"),
-            "lfo_key_sync":        (44, 1, "int"),
-            "key_to_level_depth":  (45, 1, "int"),
-            "key_num_detune_depth":(46, 1, "int"),
-            "key_follow":          (47, 1, "int"),
-            "ams_depth":           (48, 1, "int"),
-            "pms_depth":           (49, 1, "int"),
-            "pitch_bend_range":    (50, 1, "int"),
-            "aftertouch_depth":    (51, 1, "int"),
-            "poly_mono_switch":    (52, 1, "int"),
-            "unison_detune":       (53, 1, "int"),
-            "unison_pan_spread":   (54, 1, "int"),
-            "resonance_mod_depth": (55, 1, "int"),
-        }
+        # manufacturer, device_id, model_id and command are the same for every parameter
+        header = tuple(raw_message[1:5])
 
-        for param_name, (offset, length, data_type) in tone_params.items():
-            if offset + length <= len(payload):
-                if data_type == "string":
-                    raw_bytes = payload[offset : offset + length]
-                    value = raw_bytes.decode("ascii", errors="ignore").rstrip("\x00")
-                elif data_type == "array":
-                    value = list(payload[offset : offset + length])
-                else:
-                    value = int(payload[offset])
+        block = _TONE_STRUCT.unpack_from(payload)
 
-                # Get interpreted value  
-                interpreted_value, value_range = self._interpret_parameter_value("Tone", param_name, value)
+        # The length check above already covers every offset in the layout
+        for param_name, offset, length, data_type in self._TONE_LAYOUT:
+            if data_type == "string":
+                raw_bytes = payload[offset : offset + length]
+                value = raw_bytes.decode("ascii", errors="ignore").rstrip("\x00")
+            elif data_type == "array":
+                value = list(block[offset : offset + length])
+            else:
+                value = block[offset]
 
-                param = ParsedParameter(
-                    group_name="Tone",
-                    parameter_name=param_name,
-                    value=value,
-                    address=address.copy(),
-                    raw_message=list(raw_message),
-                    interpreted_value=interpreted_value,
-                    value_range=value_range,
-                    manufacturer=raw_message[1],
-                    device_id=raw_message[2],
-                    model_id=raw_message[3],
-                    command=raw_message[4]
-                )
-                parameters.append(param)
+            # Get interpreted value  
+            interpreted_value, value_range = self._interpret_parameter_value("Tone", param_name, value)
+
+            # Positional in field order: group_name, parameter_name, value, address,
+            # raw_message, patch_index, interpreted_value, value_range, then the header
+            parameters.append(ParsedParameter(
+                "Tone", param_name, value, address, raw_message, None,
+                interpreted_value, value_range, *header
+            ))
 
         return parameters
 
     def group_parameters_into_patches(self, all_params: List[ParsedParameter]) -> List[ParsedPreset]:
         """Group parameters by patch and extract MSB/LSB/PC for expansion support."""
         patches = {}
-        msb_dict = {}
-        lsb_dict = {}
-        pc_dict = {}
+        bank_vals = {}
+        pc_vals = {}
         for param in all_params:
             patch_key = param.address[1]
-            if patch_key not in patches:
+            preset = patches.get(patch_key)
+            if preset is None:
                 patch_name = "Unknown"
                 if param.group_name == "Common" and param.parameter_name == "patch_name":
                     patch_name = str(param.value) if not isinstance(param.value, str) else param.value
-                patches[patch_key] = ParsedPreset(
+                preset = patches[patch_key] = ParsedPreset(
                     name=str(patch_name),
                     preset_type="JV-1080 Patch",
                     parameters=[]
                 )
-            patches[patch_key].parameters.append(param)
+            preset.parameters.append(param)
             # Update patch metadata if we find specific parameters
             if param.group_name == "Common":
                 if param.parameter_name == "patch_name":
-                    patches[patch_key].name = str(param.value) if not isinstance(param.value, str) else param.value
+                    preset.name = str(param.value) if not isinstance(param.value, str) else param.value
                 elif param.parameter_name == "category":
-                    patches[patch_key].category = param.interpreted_value
-                elif param.parameter_name == "bank":
-                    patches[patch_key].bank = param.interpreted_value
-                elif param.parameter_name == "patch_number":
-                    patches[patch_key].patch_number = param.value
-                # Extract MSB/LSB/PC for expansion support if present
+                    preset.category = param.interpreted_value
                 elif param.parameter_name == "bank":
-                    msb_dict[patch_key] = 87 if param.value == 4 else 80  # Example: User=87, Preset=80 (adjust as needed)
+                    preset.bank = param.interpreted_value
+                    bank_vals[patch_key] = param.value
                 elif param.parameter_name == "patch_number":
-                    pc_dict[patch_key] = param.value
+                    preset.patch_number = param.value
+                    pc_vals[patch_key] = param.value
             # Optionally, extract from other param fields if needed
         # Assign MSB/LSB/PC to each patch
         for patch_key, preset in patches.items():
             # For JV-1080, MSB/LSB/PC logic may depend on bank/category/expansion
-            # Here is a basic example, adjust as needed for your expansion logic:
-            bank_val = None
-            pc_val = None
-            for p in preset.parameters:
-                if p.group_name == "Common" and p.parameter_name == "bank":
-                    bank_val = p.value
-                if p.group_name == "Common" and p.parameter_name == "patch_number":
-                    pc_val = p.value
+            bank_val = bank_vals.get(patch_key)
+            pc_val = pc_vals.get(patch_key)
+            msb_lsb = None
             # Default MSB/LSB/PC logic for JV-1080:
             if bank_val is not None and pc_val is not None:
-                if bank_val == 0:  # Preset A
-                    preset.msb, preset.lsb, preset.pc = 80, 0, pc_val
-                elif bank_val == 1:  # Preset B
-                    preset.msb, preset.lsb, preset.pc = 80, 1, pc_val
-                elif bank_val == 2:  # Preset C
-                    preset.msb, preset.lsb, preset.pc = 80, 2, pc_val
-                elif bank_val == 3:  # Preset D
-                    preset.msb, preset.lsb, preset.pc = 80, 3, pc_val
-                elif bank_val == 4:  # User
-                    preset.msb, preset.lsb, preset.pc = 87, 0, pc_val
-                elif bank_val == 5:  # Card
-                    preset.msb, preset.lsb, preset.pc = 86, 0, pc_val
+                if bank_val in _BANK_TO_MSB_LSB:
+                    msb_lsb = _BANK_TO_MSB_LSB[bank_val]
                 elif 32 <= bank_val <= 50:  # Expansion boards (SR-JV80-01..)
                     # Roland expansion: MSB=89, LSB=bank_val-32, PC=patch_number
-                    preset.msb, preset.lsb, preset.pc = 89, bank_val-32, pc_val
-                else:
-                    preset.msb, preset.lsb, preset.pc = None, None, pc_val
-            else:
-                preset.msb, preset.lsb, preset.pc = None, None, pc_val
+                    msb_lsb = (89, bank_val - 32)
+            preset.msb, preset.lsb = msb_lsb or (None, None)
+            preset.pc = pc_val
         return list(patches.values())
     
     def export_presets_to_yaml(self, presets: List[ParsedPreset], output_file: str):
@@ -631,6 +684,7 @@ class SysExParser:
             yaml.dump(
                 preset_data,
                 f,
+                Dumper=_Dumper,
                 default_flow_style=False,
                 indent=2,
                 allow_unicode=True
@@ -694,8 +748,8 @@ class SysExParser:
                     'range': param.value_range
                 }
             preset_data.append(preset_dict)
-        with open(output_file, 'w') as f:
-            json.dump(preset_data, f, indent=2)
+        with open(output_file, 'wb') as f:
+            f.write(_dumps_pretty(preset_data))
         logging.info(f"Exported {len(presets)} presets to {output_file}")
 
     def export_tone_parameters_yaml(self, tone_params: List[ParsedParameter], output_file: str):
@@ -705,7 +759,7 @@ class SysExParser:
             # Only output the raw value, not interpreted/range
             flat[param.parameter_name] = param.value
         with open(output_file, 'w', encoding='utf-8') as f:
-            yaml.dump(flat, f, default_flow_style=False, indent=2, allow_unicode=True)
+            yaml.dump(flat, f, Dumper=_Dumper, default_flow_style=False, indent=2, allow_unicode=True)
         logging.info(f"Exported flat Tone parameters to {output_file}")
 
     def export_common_parameters_yaml(self, common_params: List[ParsedParameter], output_file: str):
@@ -717,7 +771,7 @@ class SysExParser:
         if 'reserved_pad1' not in flat:
             flat['reserved_pad1'] = 0
         with open(output_file, 'w', encoding='utf-8') as f:
-            yaml.dump(flat, f, default_flow_style=False, indent=2, allow_unicode=True)
+            yaml.dump(flat, f, Dumper=_Dumper, default_flow_style=False, indent=2, allow_unicode=True)
         logging.info(f"Exported flat Common parameters to {output_file}")
 
     def analyze_presets(self, presets: List[ParsedPreset]) -> AnalysisResult:
@@ -784,11 +838,11 @@ class SysExParser:
         report_data = asdict(analysis)
         
         if output_file.endswith('.json'):
-            with open(output_file, 'w') as f:
-                json.dump(report_data, f, indent=2)
+            with open(output_file, 'wb') as f:
+                f.write(_dumps_pretty(report_data))
         else:  # Default to YAML
             with open(output_file, 'w') as f:
-                yaml.dump(report_data, f, default_flow_style=False, indent=2)
+                yaml.dump(report_data, f, Dumper=_Dumper, default_flow_style=False, indent=2)
         
         logging.info(f"Exported analysis report to {output_file}")
 
@@ -883,16 +937,17 @@ class SysExParser:
                 'lsb': preset.lsb,
                 'pc': preset.pc,
                 'parameters': flat,
-                'sysex_messages': sysex_messages
+                'sysex_messages': [list(msg) for msg in sysex_messages]
             }
             safe_name = sanitize_filename(preset.name)
             file_name = f"{idx:03d}_{safe_name}.{format}"
             out_path = os.path.join(output_folder, file_name)
-            with open(out_path, 'w', encoding='utf-8') as f:
-                if format == 'json':
-                    json.dump(out_data, f, indent=2, ensure_ascii=False)
-                else:
-                    yaml.dump(out_data, f, default_flow_style=False, indent=2, allow_unicode=True)
+            if format == 'json':
+                with open(out_path, 'wb') as f:
+                    f.write(_dumps_pretty(out_data))
+            else:
+                with open(out_path, 'w', encoding='utf-8') as f:
+                    yaml.dump(out_data, f, Dumper=_Dumper, default_flow_style=False, indent=2, allow_unicode=True)
         logging.info(f"Exported {len(presets)} presets to folder {output_folder}")
 
 def main():
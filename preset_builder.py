@@ -11,6 +11,12 @@ from dataclasses import dataclass, asdict
 from jv1080_manager import JV1080Manager
 import logging
 
+# orjson is optional; it serializes considerably faster than the stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 @dataclass
 class PresetParameter:
     """Represents a single parameter in a preset."""
@@ -250,8 +256,11 @@ class PresetBuilder:
             # Convert to dict for JSON serialization
             preset_dict = asdict(preset)
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(preset_dict, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                file_path.write_bytes(orjson.dumps(preset_dict, option=orjson.OPT_INDENT_2))
+            else:
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    json.dump(preset_dict, f, indent=2, ensure_ascii=False)
             
             self.logger.info(f"Saved preset to: {file_path}")
             return True
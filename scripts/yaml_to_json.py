@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Convert a JV-1080 YAML configuration to JSON.
+JV1080Manager loads '<name>.json' instead of '<name>.yaml' while the JSON file is
+at least as new, which is much faster than parsing the YAML. Re-run this script
+after editing the YAML; the YAML stays the file to edit.
+Usage: python scripts/yaml_to_json.py [roland_jv_1080_fixed.yaml]
+"""
+import json
+import sys
+from pathlib import Path
+
+import yaml
+
+# Prefer the libyaml-backed C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+def yaml_to_json(yaml_path):
+    """Write the JSON copy of a YAML file next to it and return its path."""
+    yaml_path = Path(yaml_path)
+    json_path = yaml_path.with_suffix('.json')
+    with open(yaml_path, 'r', encoding='utf-8') as f:
+        config = yaml.load(f, Loader=_Loader)
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump(config, f, ensure_ascii=False, separators=(',', ':'))
+    return json_path
+
+if __name__ == "__main__":
+    yaml_file = sys.argv[1] if len(sys.argv) > 1 else "roland_jv_1080_fixed.yaml"
+    print(f"Wrote {yaml_to_json(yaml_file)}")
@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple, Union
 import struct
 from dataclasses import dataclass
+from functools import cached_property
 from jv1080_manager import JV1080Manager
 
 @dataclass
@@ -19,6 +20,11 @@ class ParsedParameter:
     value: Union[int, List[int]]
     address: List[int]
     raw_message: List[int]
+    
+    @cached_property
+    def address_key(self) -> bytes:
+        """Hashable form of address, computed once (e.g. for Counter/set keys)."""
+        return bytes(self.address)
 
 @dataclass
 class ParsedPreset:
@@ -95,29 +101,36 @@ class SysExParser:
     def _extract_sysex_messages(self, data: bytes) -> List[List[int]]:
         """Extract individual SysEx messages from binary data."""
         messages = []
-        current_message = []
-        in_sysex = False
-        
-        for byte in data:
-            if byte == 0xF0:  # Start of SysEx
-                if in_sysex and current_message:
-                    # Malformed: new SysEx before previous ended
-                    self.logger.warning("Malformed SysEx: F0 found before F7")
-                current_message = [byte]
-                in_sysex = True
-            elif byte == 0xF7:  # End of SysEx
-                if in_sysex:
-                    current_message.append(byte)
-                    messages.append(current_message)
-                    current_message = []
-                    in_sysex = False
-                else:
-                    self.logger.warning("Malformed SysEx: F7 found without F0")
-            elif in_sysex:
-                current_message.append(byte)
-        
-        if in_sysex and current_message:
-            self.logger.warning("Malformed SysEx: Missing F7 at end of data")
+        size = len(data)
+        pos = 0
+        
+        # Jump between F0/F7 delimiters with bytes.find rather than
+        # visiting every byte in Python
+        while True:
+            start = data.find(b'\xF0', pos)
+            gap_end = size if start == -1 else start
+            for _ in range(data.count(b'\xF7', pos, gap_end)):
+                self.logger.warning("Malformed SysEx: F7 found without F0")
+            if start == -1:
+                break
+            
+            while True:
+                end = data.find(b'\xF7', start + 1)
+                if end == -1:
+                    end = size
+                restart = data.find(b'\xF0', start + 1, end)
+                if restart == -1:
+                    break
+                # Malformed: new SysEx before previous ended
+                self.logger.warning("Malformed SysEx: F0 found before F7")
+                start = restart
+            
+            if end == size:
+                self.logger.warning("Malformed SysEx: Missing F7 at end of data")
+                break
+            
+            messages.append(list(data[start:end + 1]))
+            pos = end + 1
         
         return messages
     
@@ -128,7 +141,7 @@ class SysExParser:
         
         # Extract address and data (everything between header and checksum)
         checksum_data = message[5:-2]  # Skip F0+header and checksum+F7
-        calculated = (0x80 - (sum(checksum_data) % 0x80)) % 0x80
+        calculated = (-sum(checksum_data)) & 0x7F
         received = message[-2]
         
         return calculated == received
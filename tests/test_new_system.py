@@ -11,6 +11,8 @@ from unittest.mock import Mock, patch, MagicMock
 from jv1080_manager import JV1080Manager
 from sysex_parser import SysExParser
 from preset_builder import PresetBuilder, JV1080Preset, PresetParameter
+from comprehensive_yaml_fixer import fix_yaml_comprehensively
+from fix_yaml_syntax import fix_yaml_syntax_errors
 
 class TestJV1080Manager:
     """Test the main JV1080Manager class."""
@@ -58,7 +60,7 @@ class TestJV1080Manager:
         assert message[2] == 0x10  # Device ID
         assert message[3] == 0x6A  # JV-1080 model ID
         assert message[4] == 0x12  # DT1 command
-        assert message[5:9] == [0x01, 0x00, 0x00, 0x00]  # Address
+        assert message[5:9] == bytes([0x01, 0x00, 0x00, 0x00])  # Address
         assert message[9] == 65   # Data (ASCII 'A')
         assert message[-1] == 0xF7  # SysEx end
         
@@ -67,6 +69,31 @@ class TestJV1080Manager:
         expected_checksum = (0x80 - (sum(checksum_data) % 0x80)) % 0x80
         assert message[-2] == expected_checksum
     
+    def test_build_parameter_block_message(self):
+        """Test building one SysEx message for consecutive parameters."""
+        manager = JV1080Manager()
+        
+        name = b"BLOCK TEST  "
+        message = manager.build_parameter_block_message(
+            group_name='temp_performance_common',
+            start_parameter='Performance name 1',
+            values=name
+        )
+        
+        assert message[:5] == bytes([0xF0, 0x41, 0x10, 0x6A, 0x12])
+        assert message[5:9] == bytes([0x01, 0x00, 0x00, 0x00])  # Address of first character
+        assert message[9:-2] == name
+        assert message[-1] == 0xF7
+        assert (sum(message[5:-1]) % 0x80) == 0  # Checksum covers the whole block
+        
+        # Each value is validated against the parameter at its address
+        with pytest.raises(ValueError):
+            manager.build_parameter_block_message('temp_performance_common', 'EFX:Type', [5, 10])  # EFX:Parameter 1 min is 32
+        
+        # The block may not run past the last defined parameter
+        with pytest.raises(ValueError):
+            manager.build_parameter_block_message('temp_performance_common', 'Reverb:Level', [10, 10])
+    
     def test_parameter_validation(self):
         """Test parameter validation."""
         manager = JV1080Manager()
@@ -109,6 +136,16 @@ class TestJV1080Manager:
         assert ports == ['Port 1', 'Port 2']
         mock_get_names.assert_called_once()
     
+    @patch('jv1080_manager.get_output_names')
+    def test_select_midi_port_from_environment(self, mock_get_names, monkeypatch):
+        """Test that JV1080_PORT skips port enumeration."""
+        monkeypatch.setenv('JV1080_PORT', 'Port 2')
+        
+        manager = JV1080Manager()
+        
+        assert manager.select_midi_port() == 'Port 2'
+        mock_get_names.assert_not_called()
+    
     @patch('jv1080_manager.open_output')
     def test_send_sysex(self, mock_open_output):
         """Test SysEx message sending."""
@@ -123,6 +160,56 @@ class TestJV1080Manager:
         assert result is True
         mock_open_output.assert_called_once_with("test_port")
         mock_port.send.assert_called_once()
+        
+        # An already open port is used as is
+        open_port = Mock()
+        manager.delay = 0
+        assert manager.send_sysex(message, open_port) is True
+        mock_open_output.assert_called_once()
+        open_port.send.assert_called_once()
+
+    
+    @patch('jv1080_manager.open_output')
+    def test_send_parameter_block(self, mock_open_output):
+        """Test that a parameter block is sent as a single message."""
+        mock_port = Mock()
+        mock_open_output.return_value.__enter__.return_value = mock_port
+        
+        manager = JV1080Manager()
+        manager.delay = 0
+        
+        result = manager.send_parameter_block('temp_performance_common', 'EFX:Type', [5, 64, 100], "test_port")
+        
+        assert result is True
+        mock_port.send.assert_called_once()
+        sent = mock_port.send.call_args[0][0]
+        assert list(sent.data[8:11]) == [5, 64, 100]
+
+    @patch('jv1080_manager.open_output')
+    def test_send_parameters(self, mock_open_output):
+        """Test that several parameters are sent over one port connection."""
+        mock_port = Mock()
+        mock_open_output.return_value.__enter__.return_value = mock_port
+        
+        manager = JV1080Manager()
+        manager.delay = 0
+        
+        result = manager.send_parameters([
+            ('temp_performance_common', 'Performance name 1', 65),
+            ('temp_performance_common', 'Performance name 2', 66),
+        ], "test_port")
+        
+        assert result is True
+        mock_open_output.assert_called_once_with("test_port")
+        assert mock_port.send.call_count == 2
+        
+        # An invalid value sends nothing
+        mock_port.reset_mock()
+        assert manager.send_parameters([
+            ('temp_performance_common', 'Performance name 1', 65),
+            ('temp_performance_common', 'EFX:Type', 200),
+        ], "test_port") is False
+        mock_port.send.assert_not_called()
 
 
 class TestSysExParser:
@@ -289,6 +376,71 @@ class TestPresetBuilder:
 
 
 # Integration tests
+class TestYamlFixers:
+    """Test the YAML fixer scripts on malformed fragments."""
+    
+    def test_comprehensive_fixer_keeps_pass_order(self, tmp_path):
+        """Test that the fixer's passes still run in their original order.
+        
+        The expected output is deliberately the original fixer's (invalid YAML)
+        result: offset_hex is indented before names are quoted, so the name
+        quoting pattern then joins it onto the name line. Running the quote
+        fixes first would give different output.
+        """
+        yaml_file = tmp_path / "fragment.yaml"
+        yaml_file.write_text(
+            'parameters:\n'
+            '  - name: Pitch Bend\n'
+            'offset_hex: "00"\n'
+            '  min: 0\n',
+            encoding='utf-8'
+        )
+        
+        fix_yaml_comprehensively(str(yaml_file))
+        
+        # Known limitation kept as-is: the indented offset_hex line ends up
+        # inside the quoted name line
+        assert yaml_file.read_text(encoding='utf-8') == (
+            'parameters:\n'
+            '  - name: "Pitch Bend " offset_hex: "00"\n'
+            '          min: 0\n'
+        )
+    
+    def test_syntax_fixer_line_endings_and_unicode_indent(self, tmp_path):
+        """Test CRLF/CR line endings and non-ASCII indentation in the syntax fixer."""
+        yaml_file = tmp_path / "fragment.yaml"
+        original = (
+            'group:\r\n'
+            '  parameters:\r\n'
+            '    - name: Level\r\n'
+            '\u00a0  min: 0\r'
+            'max: 127\r\n'
+        ).encode('utf-8')
+        yaml_file.write_bytes(original)
+        
+        fixed = fix_yaml_syntax_errors(yaml_file)
+        
+        # Line endings become \n and the NBSP counts towards odd indentation
+        expected = (
+            'group:\n'
+            '  parameters:\n'
+            '    - name: "Level"\n'
+            ' \u00a0  min: 0\n'
+            'max: 127\n'
+        ).encode('utf-8')
+        assert fixed == expected
+        assert yaml_file.read_bytes() == expected
+        assert (tmp_path / "fragment_backup.yaml").read_bytes() == original
+    
+    def test_syntax_fixer_normalizes_line_endings_only(self, tmp_path):
+        """Test that CRLF line endings alone still cause a rewrite."""
+        yaml_file = tmp_path / "fragment.yaml"
+        yaml_file.write_bytes(b'group:\r\n  value: 1\r\n')
+        
+        assert fix_yaml_syntax_errors(yaml_file) == b'group:\n  value: 1\n'
+        assert yaml_file.read_bytes() == b'group:\n  value: 1\n'
+
+
 class TestSystemIntegration:
     """Test integration between components."""
     